@@ -2,53 +2,60 @@ from PyQt6.Qsci import QsciLexerCPP
 from PyQt6.QtGui import QColor, QFont
 
 
+# Dark theme colors, parsed once and shared by every lexer instance
+_DEFAULT_PAPER = QColor("#1e1e1e")
+_DEFAULT_COLOR = QColor("#d4d4d4")
+
+_KEYWORD_COLOR = QColor("#569cd6")       # blue
+_COMMENT_COLOR = QColor("#57a64a")       # green
+_STRING_COLOR = QColor("#ce9178")        # orange
+_NUMBER_COLOR = QColor("#b5cea8")        # light green
+_OPERATOR_COLOR = QColor("#d4d4d4")      # white
+_PREPROCESSOR_COLOR = QColor("#c586c0")  # purple
+
+_PALETTE = {
+    QsciLexerCPP.Keyword: _KEYWORD_COLOR,
+    QsciLexerCPP.Comment: _COMMENT_COLOR,
+    QsciLexerCPP.CommentLine: _COMMENT_COLOR,
+    QsciLexerCPP.CommentDoc: _COMMENT_COLOR,
+    QsciLexerCPP.DoubleQuotedString: _STRING_COLOR,
+    QsciLexerCPP.SingleQuotedString: _STRING_COLOR,
+    QsciLexerCPP.Number: _NUMBER_COLOR,
+    QsciLexerCPP.Operator: _OPERATOR_COLOR,
+    QsciLexerCPP.PreProcessor: _PREPROCESSOR_COLOR,
+}
+
+
 class GSCLexer(QsciLexerCPP):
     """Custom lexer for GSC syntax highlighting"""
+
+    # Keyword sets are joined once; QScintilla queries them on every restyle
+    _KEYWORDS = {
+        # Control flow keywords
+        1: " ".join([
+            "if", "else", "for", "while", "do", "switch", "case", "default",
+            "break", "continue", "return", "wait", "waittill", "endon",
+            "notify", "thread", "true", "false", "undefined", "function"
+        ]),
+        # Built-in identifiers
+        2: " ".join([
+            "self", "level", "game", "iprintln", "iprintlnbold", "setdvar",
+            "getdvar", "precachemodel", "precacheshader", "spawn", "spawnstruct",
+            "getent", "getentarray", "distance", "vectornormalize", "angles_to_forward",
+            "playfx", "playsound", "playsoundatpos", "earthquake", "radiusdamage",
+            "maps", "common_scripts", "utility"
+        ]),
+    }
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
         # Set dark theme colors
-        self.setDefaultPaper(QColor("#1e1e1e"))
-        self.setDefaultColor(QColor("#d4d4d4"))
-        
-        # Keywords (blue)
-        self.setColor(QColor("#569cd6"), QsciLexerCPP.Keyword)
-        
-        # Comments (green)
-        self.setColor(QColor("#57a64a"), QsciLexerCPP.Comment)
-        self.setColor(QColor("#57a64a"), QsciLexerCPP.CommentLine)
-        self.setColor(QColor("#57a64a"), QsciLexerCPP.CommentDoc)
-        
-        # Strings (orange)
-        self.setColor(QColor("#ce9178"), QsciLexerCPP.DoubleQuotedString)
-        self.setColor(QColor("#ce9178"), QsciLexerCPP.SingleQuotedString)
-        
-        # Numbers (light green)
-        self.setColor(QColor("#b5cea8"), QsciLexerCPP.Number)
-        
-        # Operators (white)
-        self.setColor(QColor("#d4d4d4"), QsciLexerCPP.Operator)
-        
-        # Preprocessor (purple)
-        self.setColor(QColor("#c586c0"), QsciLexerCPP.PreProcessor)
+        self.setDefaultPaper(_DEFAULT_PAPER)
+        self.setDefaultColor(_DEFAULT_COLOR)
+        for style, color in _PALETTE.items():
+            self.setColor(color, style)
     
     def keywords(self, set):
         """Define GSC keywords"""
-        if set == 1:
-            # Control flow keywords
-            return " ".join([
-                "if", "else", "for", "while", "do", "switch", "case", "default",
-                "break", "continue", "return", "wait", "waittill", "endon",
-                "notify", "thread", "true", "false", "undefined", "function"
-            ])
-        elif set == 2:
-            # Built-in identifiers
-            return " ".join([
-                "self", "level", "game", "iprintln", "iprintlnbold", "setdvar",
-                "getdvar", "precachemodel", "precacheshader", "spawn", "spawnstruct",
-                "getent", "getentarray", "distance", "vectornormalize", "angles_to_forward",
-                "playfx", "playsound", "playsoundatpos", "earthquake", "radiusdamage",
-                "maps", "common_scripts", "utility"
-            ])
-        return ""
+        return self._KEYWORDS.get(set, "")
@@ -1,7 +1,13 @@
 import os
+import sys
+import ctypes
+import functools
+import json
+import threading
+import time
 from pathlib import Path
 from enum import IntEnum
-import psutil
+from typing import Union
 
 
 class TargetGame(IntEnum):
@@ -23,106 +29,305 @@ class GameMode(IntEnum):
     BOTH = 2
 
 
+# Seconds a game-running result is considered fresh before a background rescan
+_RUNNING_TTL = 1.5
+
+# Mode-specific script folder layout per game, relative to the Plutonium storage base.
+# Keys are normalized to plain ints below so lookups skip IntEnum hashing.
+_PATH_TEMPLATES = {
+    TargetGame.PLUTONIUM_T6: {
+        GameMode.MULTIPLAYER: ("t6", "scripts", "mp"),
+        GameMode.ZOMBIES: ("t6", "scripts", "zm"),
+        GameMode.BOTH: ("t6", "scripts"),
+    },
+    # BO1 (t5) uses the 'raw/scripts' layout
+    TargetGame.PLUTONIUM_T5: {
+        GameMode.MULTIPLAYER: ("t5", "raw", "scripts", "mp"),
+        GameMode.ZOMBIES: ("t5", "raw", "scripts", "zm"),
+        GameMode.BOTH: ("t5", "raw", "scripts"),
+    },
+    TargetGame.PLUTONIUM_T4: {
+        GameMode.MULTIPLAYER: ("t4", "scripts", "mp"),
+        GameMode.ZOMBIES: ("t4", "scripts", "zm"),
+        GameMode.BOTH: ("t4", "scripts"),
+    },
+    TargetGame.PLUTONIUM_IW5: {
+        GameMode.MULTIPLAYER: ("iw5", "scripts", "mp"),
+        GameMode.ZOMBIES: ("iw5", "scripts", "zm"),
+        GameMode.BOTH: ("iw5", "scripts"),
+    },
+}
+_PATH_TEMPLATES = {
+    int(game): {int(mode): tpl for mode, tpl in modes.items()}
+    for game, modes in _PATH_TEMPLATES.items()
+}
+
+# Lower-cased process names per game (Windows process names are case-insensitive)
+_PROCESS_NAMES = {
+    TargetGame.PLUTONIUM_T6: frozenset(["plutonium-bootstrapper-win32.exe", "t6mp.exe", "t6zm.exe"]),
+    TargetGame.PLUTONIUM_T5: frozenset(["plutonium-bootstrapper-win32.exe", "t5mp.exe", "t5zm.exe"]),
+    TargetGame.PLUTONIUM_T4: frozenset(["plutonium-bootstrapper-win32.exe", "t4mp.exe", "t4zm.exe"]),
+    TargetGame.PLUTONIUM_IW5: frozenset(["plutonium-bootstrapper-win32.exe", "iw5mp.exe"]),
+}
+_PROCESS_NAMES = {int(game): names for game, names in _PROCESS_NAMES.items()}
+
+_MODE_BOTH = int(GameMode.BOTH)
+
+# every process name any target game runs under, for filtering the process list
+_TARGET_NAMES = frozenset().union(*_PROCESS_NAMES.values())
+
+# Linux cuts /proc/<pid>/comm to 15 characters, so long names such as the Wine
+# bootstrapper only show up as these prefixes there
+_COMM_LEN = 15
+_TARGET_COMM_PREFIXES = frozenset(n[:_COMM_LEN] for n in _TARGET_NAMES if len(n) >= _COMM_LEN)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_plutonium_path():
+    """Locate the Plutonium storage folder under %localappdata% (probed once per process)."""
+    localappdata = os.getenv('LOCALAPPDATA')
+    if not localappdata:
+        return None
+
+    plut_path = Path(localappdata) / "Plutonium" / "storage"
+    if plut_path.exists():
+        return str(plut_path)
+    return None
+
+
+def _ensured_dirs_store():
+    """Location of the persisted ensured-directories list, or None off Windows."""
+    localappdata = os.getenv('LOCALAPPDATA')
+    if not localappdata:
+        return None
+    return os.path.join(localappdata, "GSC-IDE", "ensured.json")
+
+
+def _write_file(path, data: bytes):
+    """Write bytes to path through a raw descriptor (no io-stack buffering)."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _write_file_atomic(path, data: bytes):
+    """Write bytes to a temporary sibling and rename it over path, so a crash
+    mid-write leaves the previous contents intact."""
+    tmp = path + '.tmp'
+    _write_file(tmp, data)
+    os.replace(tmp, path)
+
+
+def _win_process_names():
+    """Return the executable names of running processes using a single
+    Toolhelp32 snapshot (Windows only). Names that cannot be game targets are
+    skipped."""
+    from ctypes import wintypes
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_void_p),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", ctypes.c_long),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", ctypes.c_wchar * 260),
+        ]
+
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+        raise OSError("CreateToolhelp32Snapshot failed")
+    names = set()
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            name = entry.szExeFile.lower()
+            if name in _TARGET_NAMES:
+                names.add(name)
+            ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return names
+
+
+def _cmdline_name(pid, comm):
+    """Full executable name for a process whose comm was cut short, taken from
+    argv[0] in /proc/<pid>/cmdline (as psutil does). Wine passes a Windows path,
+    so both separators are split on. Falls back to comm when argv[0] does not
+    extend it."""
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            argv0 = f.read().split(b'\0', 1)[0]
+    except OSError:
+        return comm
+    name = argv0.decode('utf-8', 'replace').replace('\\', '/').rsplit('/', 1)[-1].lower()
+    return name if name.startswith(comm) else comm
+
+
+def _posix_process_names():
+    """Return the names of running processes from /proc/<pid>/comm, or from
+    cmdline when comm was truncated. Names that cannot be game targets are
+    skipped. Raises OSError where there is no /proc (e.g. macOS), rather than
+    reporting every game as not running."""
+    names = set()
+    try:
+        pids = [entry for entry in os.listdir('/proc') if entry.isdigit()]
+    except OSError as e:
+        raise OSError(f"Cannot list running processes: /proc is unavailable ({e})") from e
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/comm', 'r', encoding='utf-8', errors='replace') as f:
+                name = f.read().strip()
+        except OSError:
+            # process exited between listdir and open, or access denied
+            continue
+        name = name.lower()
+        if name in _TARGET_COMM_PREFIXES:
+            name = _cmdline_name(pid, name)
+        if name in _TARGET_NAMES:
+            names.add(name)
+    return names
+
+
+def _running_process_names():
+    """Lower-cased names of running processes that may be game targets
+    (Toolhelp32 on Windows, /proc elsewhere)."""
+    if sys.platform == "win32":
+        return _win_process_names()
+    return _posix_process_names()
+
+
 class InjectionManager:
     def __init__(self):
         self.plutonium_path = self.get_plutonium_path()
         # optional overrides provided by UI (map TargetGame -> base path)
         self.custom_paths = {}
+        # effective base path per game with overrides already resolved
+        self._resolved_bases = {}
+        # resolved script folders keyed by (game, mode, plutonium_path)
+        self._path_cache = {}
+        # script folders known to exist this session
+        self._ensured_dirs = set()
+        # folders created in earlier sessions; each is re-checked with isdir once
+        # per session before it is trusted, since it may have been deleted since
+        self._persisted_dirs = self._load_ensured_dirs()
+        # (monotonic timestamp, running games) from the last process scan
+        self._running_cache = None
+        self._running_pending = False
+        self._running_lock = threading.Lock()
 
     def set_custom_paths(self, overrides: dict):
         """Provide custom base paths per TargetGame.
 
         overrides: dict where keys are TargetGame members and values are string paths.
         """
-        if not overrides:
-            self.custom_paths = {}
-            return
-        self.custom_paths = {}
-        for k, v in overrides.items():
-            try:
-                self.custom_paths[int(k)] = str(v) if v else None
-            except Exception:
-                # allow passing TargetGame directly
-                try:
-                    self.custom_paths[k] = str(v) if v else None
-                except Exception:
-                    pass
+        self._path_cache.clear()
+        self.custom_paths = {int(k): (str(v) if v else None) for k, v in (overrides or {}).items()}
+        # an absolute override replaces the base; a relative one is joined onto plutonium_path
+        self._resolved_bases = {
+            game: override if os.path.isabs(override) or not self.plutonium_path
+            else os.path.join(self.plutonium_path, override)
+            for game, override in self.custom_paths.items() if override
+        }
     
+    def _load_ensured_dirs(self):
+        store = _ensured_dirs_store()
+        if not store:
+            return set()
+        try:
+            with open(store, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            return {e for e in entries if isinstance(e, str)}
+        except Exception:
+            return set()
+
+    def _remember_ensured_dir(self, path):
+        """Record a created script folder and write the set through to disk."""
+        self._ensured_dirs.add(path)
+        if path in self._persisted_dirs:
+            return
+        self._persisted_dirs.add(path)
+        store = _ensured_dirs_store()
+        if not store:
+            return
+        try:
+            os.makedirs(os.path.dirname(store), exist_ok=True)
+            _write_file_atomic(store, json.dumps(sorted(self._persisted_dirs)).encode('utf-8'))
+        except Exception:
+            # persistence is only an optimization; the in-memory set still applies
+            pass
+
     def get_plutonium_path(self):
         """Get Plutonium installation path from %localappdata%"""
-        localappdata = os.getenv('LOCALAPPDATA')
-        if not localappdata:
-            return None
-        
-        plut_path = Path(localappdata) / "Plutonium" / "storage"
-        if plut_path.exists():
-            return str(plut_path)
-        return None
+        plut_path = _detect_plutonium_path()
+        if plut_path is None:
+            # only a successful detection is cached so a later install is still picked up
+            _detect_plutonium_path.cache_clear()
+        return plut_path
+    
+    def invalidate_plutonium_path(self):
+        """Forget the cached detection so the next lookup probes the disk again."""
+        _detect_plutonium_path.cache_clear()
     
     def get_script_path(self, game: TargetGame, mode: GameMode):
         """Get the scripts folder path for the given game and mode"""
         if not self.plutonium_path:
             return None
-        # if overrides exist for this game, prefer them
-        base = Path(self.plutonium_path) if self.plutonium_path else None
-        override = None
-        try:
-            override = self.custom_paths.get(game)
-        except Exception:
-            override = None
-        if override:
-            # if override path is absolute, use it as base; otherwise try relative to plutonium_path
-            ov = Path(override)
-            if ov.is_absolute():
-                base = ov
-            else:
-                if base:
-                    base = base / ov
-                else:
-                    base = ov
-        if not base:
-            return None
-
-        # Map each game to its mode-specific script folder structure
-        paths = {
-            TargetGame.PLUTONIUM_T6: {
-                GameMode.MULTIPLAYER: base / "t6" / "scripts" / "mp",
-                GameMode.ZOMBIES: base / "t6" / "scripts" / "zm",
-                GameMode.BOTH: base / "t6" / "scripts",
-            },
-            # BO1 (t5) uses the 'raw/scripts' layout
-            TargetGame.PLUTONIUM_T5: {
-                GameMode.MULTIPLAYER: base / "t5" / "raw" / "scripts" / "mp",
-                GameMode.ZOMBIES: base / "t5" / "raw" / "scripts" / "zm",
-                GameMode.BOTH: base / "t5" / "raw" / "scripts",
-            },
-            TargetGame.PLUTONIUM_T4: {
-                GameMode.MULTIPLAYER: base / "t4" / "scripts" / "mp",
-                GameMode.ZOMBIES: base / "t4" / "scripts" / "zm",
-                GameMode.BOTH: base / "t4" / "scripts",
-            },
-            TargetGame.PLUTONIUM_IW5: {
-                GameMode.MULTIPLAYER: base / "iw5" / "scripts" / "mp",
-                GameMode.ZOMBIES: base / "iw5" / "scripts" / "zm",
-                GameMode.BOTH: base / "iw5" / "scripts",
-            },
-        }
+        g = int(game)
+        m = int(mode)
+        cache_key = (g, m, self.plutonium_path)
+        cached = self._path_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        game_paths = paths.get(game)
+        # look the layout up first so unknown games bail out before any path work
+        game_paths = _PATH_TEMPLATES.get(g)
         if not game_paths:
             return None
+        tpl = game_paths.get(m) or game_paths[_MODE_BOTH]
 
-        target_path = game_paths.get(mode, game_paths.get(GameMode.BOTH))
+        base = self._resolved_bases.get(g, self.plutonium_path)
+        target_path = os.path.join(base, *tpl)
 
-        try:
-            target_path.mkdir(parents=True, exist_ok=True)
-        except Exception:
-            # If creation fails return string path anyway
-            return str(target_path)
+        if target_path not in self._ensured_dirs:
+            # a folder from an earlier session only needs a stat, not makedirs
+            if target_path in self._persisted_dirs and os.path.isdir(target_path):
+                self._ensured_dirs.add(target_path)
+                self._path_cache[cache_key] = target_path
+                return target_path
+            try:
+                os.makedirs(target_path, exist_ok=True)
+            except Exception:
+                # If creation fails return path anyway (and retry makedirs next time)
+                return target_path
+            self._remember_ensured_dir(target_path)
 
-        return str(target_path)
+        self._path_cache[cache_key] = target_path
+        return target_path
     
-    def inject_script(self, script: str, game: TargetGame, method: InjectionMethod, 
+    def inject_script(self, script: Union[str, bytes], game: TargetGame, method: InjectionMethod, 
                      mode: GameMode, script_name: str):
         """Deploy script to Plutonium"""
         if method == InjectionMethod.PLUTONIUM_SCRIPTS:
@@ -134,7 +339,7 @@ class InjectionManager:
         else:
             return False, "Unknown injection method"
     
-    def _inject_plutonium(self, script: str, game: TargetGame, mode: GameMode, script_name: str):
+    def _inject_plutonium(self, script: Union[str, bytes], game: TargetGame, mode: GameMode, script_name: str):
         """Write script to Plutonium scripts folder"""
         script_path = self.get_script_path(game, mode)
         
@@ -142,28 +347,71 @@ class InjectionManager:
             return False, "Plutonium not found. Install Plutonium first."
         
         # Ensure .gsc extension
-        if not script_name.endswith('.gsc'):
-            script_name += '.gsc'
+        if not script_name.lower().endswith('.gsc'):
+            script_name = script_name + '.gsc'
         
-        full_path = Path(script_path) / script_name
+        full_path = os.path.join(script_path, script_name)
         
         try:
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(script)
+            # bytes from the caller are written as-is; text is encoded exactly once,
+            # with '\n' translated to os.linesep as the old text-mode write did
+            if isinstance(script, str):
+                data = script.replace('\n', os.linesep).encode('utf-8')
+            else:
+                data = script
+            try:
+                _write_file(full_path, data)
+            except FileNotFoundError:
+                # folder was removed since it was ensured; recreate it and retry once
+                self._ensured_dirs.discard(script_path)
+                os.makedirs(script_path, exist_ok=True)
+                self._remember_ensured_dir(script_path)
+                _write_file(full_path, data)
             return True, f"Script deployed successfully to:\n{full_path}"
         except Exception as e:
             return False, f"Failed to write script: {str(e)}"
     
     def is_game_running(self, game: TargetGame):
         """Check if the game is currently running"""
-        process_names = {
-            TargetGame.PLUTONIUM_T6: ["plutonium-bootstrapper-win32.exe", "t6mp.exe", "t6zm.exe"],
-            TargetGame.PLUTONIUM_T5: ["plutonium-bootstrapper-win32.exe", "t5mp.exe", "t5zm.exe"],
-            TargetGame.PLUTONIUM_T4: ["plutonium-bootstrapper-win32.exe", "t4mp.exe", "t4zm.exe"],
-            TargetGame.PLUTONIUM_IW5: ["plutonium-bootstrapper-win32.exe", "iw5mp.exe"]
-        }
-        
-        target_processes = process_names.get(game, [])
-        running_processes = [p.name() for p in psutil.process_iter(['name'])]
-        
-        return any(proc in running_processes for proc in target_processes)
+        return int(game) in self.running_games()
+
+    def running_games(self):
+        """Return the set of games (as TargetGame int values) that currently
+        have a matching process.
+
+        One process scan answers every game. Results are cached for a short
+        TTL; once stale, the scan is re-run on a background thread and the
+        last known state is returned immediately so UI polling never blocks.
+        """
+        cached = self._running_cache
+        if cached is None:
+            games = self._scan_running_games()
+            self._running_cache = (time.monotonic(), games)
+            return games
+        timestamp, games = cached
+        if time.monotonic() - timestamp >= _RUNNING_TTL:
+            self._refresh_running_async()
+        return games
+
+    def _scan_running_games(self):
+        running = _running_process_names()
+        return frozenset(game for game, names in _PROCESS_NAMES.items() if names & running)
+
+    def _refresh_running_async(self):
+        with self._running_lock:
+            if self._running_pending:
+                return
+            self._running_pending = True
+
+        def worker():
+            try:
+                games = self._scan_running_games()
+                self._running_cache = (time.monotonic(), games)
+            except Exception:
+                # keep the last known state; the next poll retries
+                pass
+            finally:
+                with self._running_lock:
+                    self._running_pending = False
+
+        threading.Thread(target=worker, daemon=True).start()
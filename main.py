@@ -5,16 +5,25 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                               QHBoxLayout, QPushButton, QComboBox, QLabel, 
                               QTextEdit, QFileDialog, QSplitter, QMessageBox,
                               QLineEdit, QGroupBox, QStatusBar, QTextBrowser, QDialog, QFormLayout, QSpinBox, QComboBox as QComboBoxWidget, QStyle, QPlainTextEdit, QCheckBox, QTabWidget)
-from PyQt6.QtCore import Qt, QTimer, QSettings, QSize, QEvent
+from PyQt6.QtCore import Qt, QTimer, QSettings, QSize, QEvent, QPointF, QRect, QObject, QRunnable, QThreadPool, QThread, QFileSystemWatcher, QMutex, QWaitCondition, QSaveFile, QIODevice, pyqtSignal
 import ctypes
-from PyQt6.QtGui import QFont, QAction, QKeySequence, QSyntaxHighlighter, QTextCharFormat, QColor, QTextCursor
+from PyQt6.QtGui import QFont, QIcon, QAction, QKeySequence, QSyntaxHighlighter, QTextCharFormat, QColor, QTextCursor, QPainter, QPen, QPolygonF, QBrush
 import re
+import math
 import tempfile
 import json
 import uuid
-import unicodedata
-from weakref import WeakKeyDictionary
+from weakref import WeakKeyDictionary, WeakSet, finalize
+from collections import deque
+from queue import SimpleQueue
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain, count
 import traceback
+try:
+    import orjson  # optional: much faster autosave (de)serialization
+except ImportError:
+    orjson = None
 
 from injection_manager import InjectionManager, TargetGame, InjectionMethod, GameMode
 
@@ -35,97 +44,281 @@ def _handle_suppressed(exc: Exception, self_obj=None):
             _handle_suppressed(e, locals().get('self', None))
 
 
+# Custom shortcuts, parsed once at import
+_KS_SAVE_AS = QKeySequence("Ctrl+Shift+S")
+_KS_CLEAR_RECENT = QKeySequence("Ctrl+Shift+R")
+_KS_DEPLOY = QKeySequence("F5")
+_KS_PREFERENCES = QKeySequence("Ctrl+,")
+_KS_REPLACE = QKeySequence("Ctrl+H")
+_KS_FIND_PREVIOUS = QKeySequence("Shift+F3")
+_KS_TOGGLE_INJECTION = QKeySequence("Ctrl+Shift+I")
+_KS_TOGGLE_OUTPUT = QKeySequence("Ctrl+Shift+O")
+_KS_TOGGLE_THEME = QKeySequence("Ctrl+T")
+_KS_CLOSE_TAB = QKeySequence("Ctrl+W")
+
+# QSettings may hand back booleans as strings depending on the backend
+_TRUE_SET = frozenset(('1', 'true', 'yes', 'on'))
+
+
+def _as_bool(v, default=False):
+    """Normalize a settings value to bool."""
+    if v is None:
+        return default
+    return v.lower() in _TRUE_SET if isinstance(v, str) else bool(v)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, via orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects lone surrogates; the stdlib escapes them
+            pass
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
+
+
+# QTextDocument characters that toPlainText() maps to '\n' or ' ' (one UTF-16 unit each)
+_PLAIN_TEXT_TABLE = str.maketrans({'\u2029': '\n', '\u2028': '\n', '\ufdd0': '\n', '\ufdd1': '\n', '\xa0': ' '})
+
+
+def _wal_path(snapshot_path: str) -> str:
+    """The edit log that goes with an autosave snapshot."""
+    return os.path.splitext(snapshot_path)[0] + '.wal'
+
+
+def _replay_wal(content: str, blob: bytes, gen) -> str:
+    """Apply the edit records of snapshot generation gen to its content.
+
+    Records hold QTextDocument positions, which count UTF-16 code units, so
+    the edits are applied to the UTF-16 encoding of the text.
+    """
+    buf = bytearray(content.encode('utf-16-le', 'surrogatepass'))
+    for line in blob.splitlines():
+        try:
+            rec = _json_loads(line)
+        except ValueError:
+            break  # torn last record from a crash mid-append
+        # records left over from before the snapshot was rewritten
+        if rec.get('g') != gen:
+            continue
+        p = rec['p'] * 2
+        buf[p:p + rec['r'] * 2] = rec['a'].encode('utf-16-le', 'surrogatepass')
+    return buf.decode('utf-16-le', 'surrogatepass')
+
+
+def _parse_autosave_index(blob: bytes) -> list:
+    """Live entries of an autosave index.
+
+    The index is a log of upsert/remove records, one JSON object per line;
+    older versions wrote a single JSON list, which is still accepted.
+    """
+    if blob.lstrip().startswith(b'['):
+        return _json_loads(blob)
+    live = {}
+    for line in blob.splitlines():
+        try:
+            rec = _json_loads(line)
+        except ValueError:
+            break  # torn last record from a crash mid-append
+        if rec.get('op') == 'remove':
+            live.pop(rec.get('file'), None)
+        else:
+            live[rec.get('file')] = {'file': rec.get('file'), 'filename': rec.get('filename')}
+    return list(live.values())
+
+
+def _remove_if_exists(path: str):
+    """os.remove that ignores a missing file (one syscall instead of stat + unlink)."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _write_atomic(path: str, blob: bytes):
+    """Replace path with blob so readers never see a half-written file.
+
+    QSaveFile writes to a temporary file and only renames it over path on
+    commit(), which also flushes it to disk.
+    """
+    sf = QSaveFile(path)
+    if not sf.open(QIODevice.OpenModeFlag.WriteOnly):
+        raise OSError(f"{path}: {sf.errorString()}")
+    if sf.write(blob) != len(blob):
+        sf.cancelWriting()
+        sf.commit()  # discards the temporary file
+        raise OSError(f"{path}: {sf.errorString()}")
+    if not sf.commit():
+        raise OSError(f"{path}: {sf.errorString()}")
+
+
 class GSCSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for GSC language"""
+
+    # Define keywords (identifiers are classified by set membership)
+    keywords = frozenset([
+        'if', 'else', 'for', 'while', 'do', 'switch', 'case', 'default',
+        'break', 'continue', 'return', 'wait', 'waittill', 'endon',
+        'notify', 'thread', 'true', 'false', 'undefined', 'function'
+    ])
+
+    # Built-in identifiers
+    builtins = frozenset([
+        'self', 'level', 'game', 'iprintln', 'iprintlnbold', 'setdvar',
+        'getdvar', 'precachemodel', 'precacheshader', 'spawn', 'spawnstruct',
+        'getent', 'getentarray', 'distance', 'vectornormalize', 'angles_to_forward',
+        'playfx', 'playsound', 'playsoundatpos', 'earthquake', 'radiusdamage'
+    ])
+
+    # Character classes for the block scanner
+    _IDENT_START = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_')
+    _IDENT_CHARS = _IDENT_START | frozenset('0123456789')
+    _DIGITS = frozenset('0123456789')
+    _IDENT_TAIL_RE = re.compile(r'[A-Za-z0-9_]*')
+    _BLOCK_COMMENT_RE = re.compile(r'/\*|\*/')
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        
-        # Define formatting styles
-        self.keyword_format = QTextCharFormat()
-        self.keyword_format.setForeground(QColor("#569cd6"))
-        self.keyword_format.setFontWeight(700)
-        
-        self.builtin_format = QTextCharFormat()
-        self.builtin_format.setForeground(QColor("#4ec9b0"))
-        
-        self.string_format = QTextCharFormat()
-        self.string_format.setForeground(QColor("#ce9178"))
-        
-        self.comment_format = QTextCharFormat()
-        self.comment_format.setForeground(QColor("#6a9955"))
-        self.comment_format.setFontItalic(True)
-        
-        self.number_format = QTextCharFormat()
-        self.number_format.setForeground(QColor("#b5cea8"))
+    @classmethod
+    def _init_formats(cls):
+        """Build the shared formatting styles once for every highlighter."""
+        cls.keyword_format = QTextCharFormat()
+        cls.keyword_format.setForeground(QColor("#569cd6"))
+        cls.keyword_format.setFontWeight(700)
         
-        self.function_format = QTextCharFormat()
-        self.function_format.setForeground(QColor("#dcdcaa"))
+        cls.builtin_format = QTextCharFormat()
+        cls.builtin_format.setForeground(QColor("#4ec9b0"))
         
-        # Define keywords
-        self.keywords = [
-            'if', 'else', 'for', 'while', 'do', 'switch', 'case', 'default',
-            'break', 'continue', 'return', 'wait', 'waittill', 'endon',
-            'notify', 'thread', 'true', 'false', 'undefined', 'function'
-        ]
+        cls.string_format = QTextCharFormat()
+        cls.string_format.setForeground(QColor("#ce9178"))
         
-        # Built-in identifiers
-        self.builtins = [
-            'self', 'level', 'game', 'iprintln', 'iprintlnbold', 'setdvar',
-            'getdvar', 'precachemodel', 'precacheshader', 'spawn', 'spawnstruct',
-            'getent', 'getentarray', 'distance', 'vectornormalize', 'angles_to_forward',
-            'playfx', 'playsound', 'playsoundatpos', 'earthquake', 'radiusdamage'
-        ]
+        cls.comment_format = QTextCharFormat()
+        cls.comment_format.setForeground(QColor("#6a9955"))
+        cls.comment_format.setFontItalic(True)
         
-        # Build highlighting rules
-        self.rules = []
+        cls.number_format = QTextCharFormat()
+        cls.number_format.setForeground(QColor("#b5cea8"))
         
-        # Keywords
-        for word in self.keywords:
-            pattern = f'\\b{word}\\b'
-            self.rules.append((re.compile(pattern), self.keyword_format))
-        
-        # Built-ins
-        for word in self.builtins:
-            pattern = f'\\b{word}\\b'
-            self.rules.append((re.compile(pattern), self.builtin_format))
-        
-        # Numbers
-        self.rules.append((re.compile(r'\b[0-9]+\.?[0-9]*\b'), self.number_format))
-        
-        # Strings
-        self.rules.append((re.compile(r'"[^"\\]*(\\.[^"\\]*)*"'), self.string_format))
-        
-        # Single-line comments
-        self.rules.append((re.compile(r'//[^\n]*'), self.comment_format))
-        
-        # Functions
-        self.rules.append((re.compile(r'\b[A-Za-z_][A-Za-z0-9_]*(?=\s*\()'), self.function_format))
-    
-    def highlightBlock(self, text):
-        # Apply syntax highlighting rules
-        for pattern, format in self.rules:
-            for match in pattern.finditer(text):
-                start = match.start()
-                length = match.end() - start
-                self.setFormat(start, length, format)
-        
-        # Multi-line comments
-        self.setCurrentBlockState(0)
-        start_index = 0
-        if self.previousBlockState() != 1:
-            start_index = text.find('/*')
-        
-        while start_index >= 0:
-            end_index = text.find('*/', start_index)
-            if end_index == -1:
-                self.setCurrentBlockState(1)
-                comment_length = len(text) - start_index
+        cls.function_format = QTextCharFormat()
+        cls.function_format.setForeground(QColor("#dcdcaa"))
+
+    def _tokenize(self, text):
+        """Scan one block and yield (start, length, format) for each token.
+
+        Dispatches on the current character instead of running every pattern
+        over the line. Identifier tails (and digit runs glued to letters) still
+        use one anchored regex match each, so a match object is created per
+        identifier; numbers, strings and comments are scanned without one.
+        """
+        keywords = self.keywords
+        builtins = self.builtins
+        ident_start = self._IDENT_START
+        ident_chars = self._IDENT_CHARS
+        digits = self._DIGITS
+        ident_tail = self._IDENT_TAIL_RE.match
+        find = text.find
+        n = len(text)
+        i = 0
+        while i < n:
+            ch = text[i]
+            if ch in ident_start:
+                j = ident_tail(text, i + 1).end()
+                word = text[i:j]
+                if word in keywords:
+                    yield i, j - i, self.keyword_format
+                elif word in builtins:
+                    yield i, j - i, self.builtin_format
+                else:
+                    # function call/definition: identifier followed by '('
+                    k = j
+                    while k < n and text[k] in ' \t':
+                        k += 1
+                    if k < n and text[k] == '(':
+                        yield i, j - i, self.function_format
+                i = j
+            elif ch in digits:
+                j = i + 1
+                while j < n and text[j] in digits:
+                    j += 1
+                if j + 1 < n and text[j] == '.' and text[j + 1] in digits:
+                    j += 2
+                    while j < n and text[j] in digits:
+                        j += 1
+                if j < n and text[j] in ident_chars:
+                    # not a number, e.g. '5abc'
+                    i = ident_tail(text, j).end()
+                    continue
+                yield i, j - i, self.number_format
+                i = j
+            elif ch == '"':
+                # find the closing quote that is not escaped by a backslash
+                j = i + 1
+                while True:
+                    q = find('"', j)
+                    if q == -1:
+                        break
+                    b = q - 1
+                    while text[b] == '\\':
+                        b -= 1
+                    if (q - 1 - b) % 2 == 0:
+                        break
+                    j = q + 1
+                if q == -1:
+                    # unterminated string: leave it unformatted
+                    i += 1
+                else:
+                    yield i, q + 1 - i, self.string_format
+                    i = q + 1
+            elif ch == '/' and text.startswith('/', i + 1):
+                yield i, n - i, self.comment_format
+                return
             else:
-                comment_length = end_index - start_index + 2
-            
-            self.setFormat(start_index, comment_length, self.comment_format)
-            start_index = text.find('/*', start_index + comment_length)
+                i += 1
+
+    def highlightBlock(self, text):
+        # Qt re-runs this only for edited blocks and keeps going downstream only
+        # while a block's end state (0 = code, 1 = inside /* */) changes. Blocks
+        # that sit entirely inside an open block comment need no token scan.
+        if self.previousBlockState() == 1 and '*/' not in text:
+            self.setFormat(0, len(text), self.comment_format)
+            self.setCurrentBlockState(1)
+            return
+
+        # Apply syntax highlighting from a single character scan
+        set_format = self.setFormat
+        for start, length, fmt in self._tokenize(text):
+            set_format(start, length, fmt)
+        
+        # Multi-line comments: walk the /* and */ markers in one scan
+        comment_format = self.comment_format
+        in_comment = self.previousBlockState() == 1
+        comment_start = 0
+        for match in self._BLOCK_COMMENT_RE.finditer(text):
+            if in_comment:
+                if match.group() == '*/':
+                    self.setFormat(comment_start, match.end() - comment_start, comment_format)
+                    in_comment = False
+            elif match.group() == '/*':
+                in_comment = True
+                comment_start = match.start()
+        if in_comment:
+            self.setFormat(comment_start, len(text) - comment_start, comment_format)
+        self.setCurrentBlockState(1 if in_comment else 0)
+
+
+GSCSyntaxHighlighter._init_formats()
+
+
+# Pre-built gutter labels so painting does not allocate a string per line
+_LINENO_CACHE = tuple(str(i) for i in range(8193))
 
 
 class LineNumberArea(QWidget):
@@ -144,9 +337,57 @@ class LineNumberArea(QWidget):
 
 class GSCEditor(QPlainTextEdit):
     """Custom text editor with line numbers and syntax highlighting"""
+
+    # Lint squiggle shape: sin offsets for one wavelength (6px, amplitude 3px)
+    _WAVE_LUT = tuple(math.sin((i / 6) * 2 * math.pi) * 3 for i in range(6))
+
+    # Starter script for new tabs
+    _DEFAULT_TEMPLATE = """// GSC IDE - Plutonium Script
+// Game: Black Ops 2 (T6)
+// Mode: Multiplayer/Zombies
+
+#include maps\\mp\\_utility;
+#include common_scripts\\utility;
+
+init()
+{
+\tlevel thread onPlayerConnect();
+}
+
+onPlayerConnect()
+{
+\tfor(;;)
+\t{
+\t\tlevel waittill("connected", player);
+\t\tplayer thread onPlayerSpawned();
+\t}
+}
+
+onPlayerSpawned()
+{
+\tself endon("disconnect");
+\t
+\tfor(;;)
+\t{
+\t\tself waittill("spawned_player");
+\t\tself iprintlnbold("^2Welcome! ^7Script loaded via GSC IDE");
+\t}
+}
+"""
+    # what closeEvent compares untitled tabs against
+    _DEFAULT_TEMPLATE_STRIPPED = _DEFAULT_TEMPLATE.strip()
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # gutter width cache; reset on font changes (see changeEvent)
+        self._digit_advance = None
+        self._last_block_count = -1
+        self._gutter_width = 0
+        # paint resources reused by every repaint
+        self._gutter_bg_brush = QBrush(QColor("#252526"))
+        self._gutter_fg = QColor("#858585")
+        self._lint_pen = QPen(QColor('#ff5c5c'))
+        self._lint_pen.setWidthF(1.4)
         
         # Set font
         font = QFont("Consolas", 11)
@@ -156,8 +397,9 @@ class GSCEditor(QPlainTextEdit):
         # Set tab width
         self.setTabStopDistance(self.fontMetrics().horizontalAdvance(' ') * 4)
         
-        # Apply syntax highlighter
-        self.highlighter = GSCSyntaxHighlighter(self.document())
+        # Syntax highlighter is attached when the tab is first shown
+        # (see GSCIDEWindow._ensure_highlighter)
+        self.highlighter = None
         
         # Line numbers
         self.line_number_area = LineNumberArea(self)
@@ -203,43 +445,25 @@ class GSCEditor(QPlainTextEdit):
             return False
     
     def get_default_template(self):
-        return """// GSC IDE - Plutonium Script
-// Game: Black Ops 2 (T6)
-// Mode: Multiplayer/Zombies
-
-#include maps\\mp\\_utility;
-#include common_scripts\\utility;
-
-init()
-{
-\tlevel thread onPlayerConnect();
-}
-
-onPlayerConnect()
-{
-\tfor(;;)
-\t{
-\t\tlevel waittill("connected", player);
-\t\tplayer thread onPlayerSpawned();
-\t}
-}
-
-onPlayerSpawned()
-{
-\tself endon("disconnect");
-\t
-\tfor(;;)
-\t{
-\t\tself waittill("spawned_player");
-\t\tself iprintlnbold("^2Welcome! ^7Script loaded via GSC IDE");
-\t}
-}
-"""
+        return self._DEFAULT_TEMPLATE
     
     def line_number_area_width(self):
-        digits = len(str(max(1, self.blockCount())))
-        space = 10 + self.fontMetrics().horizontalAdvance('9') * digits
-        return space
+        block_count = self.blockCount()
+        if block_count == self._last_block_count:
+            return self._gutter_width
+        self._last_block_count = block_count
+        if self._digit_advance is None:
+            self._digit_advance = self.fontMetrics().horizontalAdvance('9')
+        digits = len(str(max(1, block_count)))
+        self._gutter_width = 10 + self._digit_advance * digits
+        return self._gutter_width
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange:
+            # glyph advance depends on the font; remeasure on next width query
+            self._digit_advance = None
+            self._last_block_count = -1
+        super().changeEvent(event)
     
     def update_line_number_area_width(self, _):
         self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
@@ -259,35 +483,52 @@ onPlayerSpawned()
         self.line_number_area.setGeometry(cr.left(), cr.top(), self.line_number_area_width(), cr.height())
     
     def line_number_area_paint_event(self, event):
-        from PyQt6.QtGui import QPainter
-        from PyQt6.QtCore import QRect
-        
         painter = QPainter(self.line_number_area)
-        painter.fillRect(event.rect(), QColor("#252526"))
+        rect = event.rect()
+        painter.fillRect(rect, self._gutter_bg_brush)
         
         block = self.firstVisibleBlock()
         block_number = block.blockNumber()
         top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
         bottom = top + self.blockBoundingRect(block).height()
-        
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
-                painter.setPen(QColor("#858585"))
-                painter.drawText(0, int(top), self.line_number_area.width() - 5, 
-                               self.fontMetrics().height(), Qt.AlignmentFlag.AlignRight, number)
+
+        # loop invariants
+        rect_top = rect.top()
+        rect_bottom = rect.bottom()
+        text_width = self.line_number_area.width() - 5
+        line_height = self.fontMetrics().height()
+        align = Qt.AlignmentFlag.AlignRight
+        draw_text = painter.drawText
+        block_rect = self.blockBoundingRect
+        lineno_cache = _LINENO_CACHE
+        lineno_limit = len(lineno_cache)
+        painter.setPen(self._gutter_fg)
+        
+        while block.isValid() and top <= rect_bottom:
+            if block.isVisible() and bottom >= rect_top:
+                number = block_number + 1
+                draw_text(0, int(top), text_width, line_height, align,
+                          lineno_cache[number] if number < lineno_limit else str(number))
             
             block = block.next()
             top = bottom
-            bottom = top + self.blockBoundingRect(block).height()
+            bottom = top + block_rect(block).height()
             block_number += 1
 
     def set_lint_error_positions(self, positions):
         """positions: list of (start_pos, length) tuples in document coordinates."""
         try:
+            new = tuple(positions or ())
+            old = getattr(self, '_last_lint_positions', None)
+            if new == old:
+                return
+            self._last_lint_positions = new
             self.lint_error_positions = positions or []
-            # repaint viewport to show squiggles
-            self.viewport().update()
+            # repaint only the rows covered by squiggles that appeared or vanished
+            changed = set(new).symmetric_difference(old or ())
+            dirty = self._lint_ranges_rect(changed)
+            if not dirty.isEmpty():
+                self.viewport().update(dirty)
         except Exception:
             try:
                 traceback.print_exc()
@@ -303,6 +544,23 @@ onPlayerSpawned()
                     except Exception as e:
                         _handle_suppressed(e, locals().get('self', None))
 
+    def _lint_ranges_rect(self, ranges):
+        """Full-width viewport rect covering the given (start, length) ranges."""
+        dirty = QRect()
+        if not ranges:
+            return dirty
+        cursor = QTextCursor(self.document())
+        max_pos = max(0, self.document().characterCount() - 1)
+        width = self.viewport().width()
+        for start, length in ranges:
+            cursor.setPosition(min(max(0, start), max_pos))
+            top = self.cursorRect(cursor).top()
+            cursor.setPosition(min(max(0, start + length), max_pos))
+            bottom = self.cursorRect(cursor).bottom()
+            # pad for the wave amplitude drawn below the baseline
+            dirty = dirty.united(QRect(0, top, width, bottom - top + 6))
+        return dirty
+
     def paintEvent(self, event):
         # call base paint to render text and selections
         super().paintEvent(event)
@@ -310,14 +568,19 @@ onPlayerSpawned()
         if not getattr(self, 'lint_error_positions', None):
             return
         try:
-            from PyQt6.QtGui import QPainter, QPen
-            from PyQt6.QtCore import QPointF
-            import math
-
             painter = QPainter(self.viewport())
-            pen = QPen(QColor('#ff5c5c'))
-            pen.setWidthF(1.4)
-            painter.setPen(pen)
+            painter.setPen(self._lint_pen)
+
+            # resolve per-paint invariants once instead of per segment
+            doc = self.document()
+            find_block = doc.findBlock
+            cursor_rect = self.cursorRect
+            min_width = max(6, self.fontMetrics().horizontalAdvance(' '))
+            wave = self._WAVE_LUT
+            wavelength = len(wave)
+            draw_polyline = painter.drawPolyline
+            # one cursor, repositioned for each coordinate lookup
+            cursor = QTextCursor(doc)
 
             for start_pos, length in list(self.lint_error_positions):
                 if length <= 0:
@@ -326,7 +589,7 @@ onPlayerSpawned()
                 pos = start_pos
                 # iterate across blocks in case the range spans lines
                 while pos < end_pos:
-                    block = self.document().findBlock(pos)
+                    block = find_block(pos)
                     if not block.isValid():
                         break
                     block_start = block.position()
@@ -334,37 +597,23 @@ onPlayerSpawned()
                     seg_end = min(end_pos, block_end)
 
                     # cursor at segment start and end to get coordinates
-                    start_cursor = QTextCursor(self.document())
-                    start_cursor.setPosition(pos)
-                    end_cursor = QTextCursor(self.document())
-                    end_cursor.setPosition(seg_end)
-
-                    r1 = self.cursorRect(start_cursor)
-                    r2 = self.cursorRect(end_cursor)
+                    cursor.setPosition(pos)
+                    r1 = cursor_rect(cursor)
+                    cursor.setPosition(seg_end)
+                    r2 = cursor_rect(cursor)
 
                     x1 = r1.x()
                     x2 = r2.x()
                     # sometimes end cursor at line end returns same x as start; clamp to viewport
                     if x2 <= x1:
-                        x2 = x1 + max(6, self.fontMetrics().horizontalAdvance(' ')*1)
+                        x2 = x1 + min_width
 
                     y = r1.bottom() - 2
-                    amplitude = 3
-                    wavelength = 6
-                    points = []
-                    x = x1
-                    # draw points from x1 to x2
-                    while x <= x2:
-                        rel = x - x1
-                        y_offset = math.sin((rel / wavelength) * 2 * math.pi) * amplitude
-                        points.append(QPointF(x, y + y_offset))
-                        x += 2
-
+                    # sample the wave every 2px from x1 to x2 using the sine table
+                    points = [QPointF(x, y + wave[(x - x1) % wavelength]) for x in range(x1, x2 + 1, 2)]
                     # ensure last point at x2
                     points.append(QPointF(x2, y))
-                    # draw polyline
-                    from PyQt6.QtGui import QPolygonF
-                    painter.drawPolyline(QPolygonF(points))
+                    draw_polyline(QPolygonF(points))
 
                     pos = seg_end + 1
             painter.end()
@@ -384,12 +633,570 @@ onPlayerSpawned()
                         _handle_suppressed(e, locals().get('self', None))
 
 
+# Unicode category Cc (C0/C1 controls) except tab, newline and carriage return
+_LINT_CONTROL_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+# whitespace-delimited tokens long enough for the suspicious-token heuristic
+_LINT_LONG_TOKEN_RE = re.compile(r'\S{4,}')
+# Tokens the string/bracket scan reacts to; a backslash and the character
+# after it form one token so escaped quotes never toggle string state
+_LINT_TOKEN_RE = re.compile(r'\\[^\n]|["\'{}()\[\]\n]')
+_LINT_PAIRS = {'}': '{', ')': '(', ']': '['}
+
+
+# Characters between saved scanner states; an edit rescans from the last
+# state before it
+_LINT_CHECKPOINT_EVERY = 4096
+# heuristic findings; everything else is a structural error (brackets, strings)
+_LINT_MSG_CONTROL = 'Control/non-printable character detected'
+_LINT_MSG_TOKEN = 'Suspicious token or non-ASCII text'
+_LINT_HEURISTIC_MSGS = frozenset((_LINT_MSG_CONTROL, _LINT_MSG_TOKEN))
+
+
+class LintState:
+    """Everything one lint pass learned about a text snapshot.
+
+    Passed back into lint_gsc_incremental so the next pass can keep the
+    results that lie before the first changed character. Never mutated
+    after construction, so it can be handed between threads.
+    """
+
+    def __init__(self, text, errors, newlines, scan_found, control_found,
+                 token_found, offsets, checkpoints):
+        self.text = text
+        self.errors = errors
+        self.newlines = newlines  # array of '\n' offsets
+        self.scan_found = scan_found  # bracket errors from the token scan
+        self.control_found = control_found  # per-line control-character hits
+        self.token_found = token_found  # per-line suspicious-token hits
+        self.offsets = offsets  # array of checkpoint offsets, ascending
+        # (offset, len(newlines), len(scan_found), in_string, string_char,
+        #  string_start, stack) before the token at offset is processed
+        self.checkpoints = checkpoints
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    """Length of the shared prefix, found with C-level slice comparisons."""
+    n = min(len(a), len(b))
+    if a[:n] == b[:n]:
+        return n
+    lo, hi = 0, n  # a[:lo] == b[:lo] and a[:hi] != b[:hi]
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def lint_gsc_text(text: str):
+    """Simple GSC linter: unmatched brackets/parentheses and unterminated strings.
+    Pure text analysis (safe to run off the GUI thread); returns a list of
+    dicts {line, col, len, msg, pos} with 1-based lines, 0-based columns and
+    the absolute character offset of the problem.
+    """
+    return lint_gsc_incremental(text)[0]
+
+
+def lint_gsc_incremental(text: str, previous: LintState = None):
+    """lint_gsc_text that reuses `previous`, the state of an earlier snapshot.
+
+    Only the text from the last checkpoint before the first difference is
+    rescanned. Returns (errors, state) where state feeds the next call.
+    """
+    every = _LINT_CHECKPOINT_EVERY
+    dirty = 0
+    ckpt_index = -1
+    if previous is not None:
+        dirty = _common_prefix_len(previous.text, text)
+        if dirty == len(text) == len(previous.text):
+            return previous.errors, previous
+        # the checkpoint must precede the first changed character strictly:
+        # a token starting just before it may depend on that character
+        ckpt_index = bisect_right(previous.offsets, dirty - 1) - 1
+
+    pairs = _LINT_PAIRS
+    if ckpt_index >= 0:
+        (resume, n_newlines, n_found, in_string, string_char, string_start,
+         stack) = previous.checkpoints[ckpt_index]
+        newlines = previous.newlines[:n_newlines]
+        found = previous.scan_found[:n_found]
+        stack = list(stack)
+        offsets = previous.offsets[:ckpt_index + 1]
+        checkpoints = previous.checkpoints[:ckpt_index + 1]
+    else:
+        resume = 0
+        newlines = array('i')  # offsets of every '\n', filled by the scan below
+        found = []  # (pos, rank, len, msg); rank keeps the per-line report order
+        stack = []  # tuples (char, pos)
+        in_string = False
+        string_char = None
+        string_start = None
+        offsets = array('i')
+        checkpoints = []
+    next_ckpt = resume + every
+
+    # one pass over the text for strings, brackets and line breaks;
+    # the regex skips everything else without entering the Python loop
+    for m in _LINT_TOKEN_RE.finditer(text, resume):
+        ch = m.group()[0]
+        p = m.start()
+        if p >= next_ckpt:
+            offsets.append(p)
+            checkpoints.append((p, len(newlines), len(found), in_string,
+                                string_char, string_start, tuple(stack)))
+            next_ckpt = p + every
+        if ch == '\n':
+            newlines.append(p)
+            continue
+        if ch == '\\':
+            # escapes are inert inside strings; outside them only an escaped
+            # bracket still counts
+            if in_string:
+                continue
+            ch = m.group()[1]
+            p += 1
+            if ch == '"' or ch == "'":
+                continue
+        if ch == '"' or ch == "'":
+            if not in_string:
+                in_string = True
+                string_char = ch
+                string_start = p
+            elif ch == string_char:
+                in_string = False
+                string_char = None
+                string_start = None
+        elif not in_string:
+            if ch == '{' or ch == '(' or ch == '[':
+                stack.append((ch, p))
+            elif ch == '}' or ch == ')' or ch == ']':
+                if stack and stack[-1][0] == pairs[ch]:
+                    stack.pop()
+                else:
+                    found.append((p, 2, 1, f"Unmatched closing '{ch}'"))
+
+    # Quick checks, at most one of each per line: control/non-printable
+    # characters and suspicious tokens. Lines before the edited one keep
+    # their previous results.
+    line_start = text.rfind('\n', 0, dirty) + 1
+    if previous is not None:
+        control_found = previous.control_found[:bisect_left(previous.control_found, (line_start,))]
+        token_found = previous.token_found[:bisect_left(previous.token_found, (line_start,))]
+    else:
+        control_found = []
+        token_found = []
+    try:
+        search = _LINT_CONTROL_RE.search
+        m = search(text, line_start)
+        while m:
+            control_found.append((m.start(), 0, 1, _LINT_MSG_CONTROL))
+            nl = text.find('\n', m.end())
+            m = search(text, nl + 1) if nl >= 0 else None
+    except Exception as e:
+        _handle_suppressed(e, locals().get('self', None))
+    try:
+        # suspicious token heuristic: tokens with length>=4 but zero alphabetic chars
+        search = _LINT_LONG_TOKEN_RE.search
+        m = search(text, line_start)
+        while m:
+            t = m.group()
+            alpha_count = sum(1 for c in t if c.isalpha())
+            non_ascii = sum(1 for c in t if ord(c) > 127)
+            if alpha_count == 0 or non_ascii > (len(t) // 2):
+                token_found.append((m.start(), 1, len(t), _LINT_MSG_TOKEN))
+                nl = text.find('\n', m.end())
+                m = search(text, nl + 1) if nl >= 0 else None
+            else:
+                m = search(text, m.end())
+    except Exception as e:
+        _handle_suppressed(e, locals().get('self', None))
+
+    def locate(pos):
+        # (line, col) from the newline table: O(log lines) per error
+        line = bisect_right(newlines, pos) + 1
+        return line, pos - (newlines[line - 2] + 1 if line > 1 else 0)
+
+    errors = []  # list of dicts: {line, col, len, msg, pos}
+    located = []
+    for pos, rank, length, msg in chain(found, control_found, token_found):
+        line, col = locate(pos)
+        located.append((line, rank, pos, length, msg, col))
+    located.sort()
+    for line, rank, pos, length, msg, col in located:
+        errors.append({'line': line, 'col': col, 'len': length, 'msg': msg, 'pos': pos})
+
+    if in_string and string_start is not None:
+        line, col = locate(string_start)
+        errors.append({'line': line, 'col': col, 'len': 1, 'msg': 'Unterminated string literal', 'pos': string_start})
+
+    # any remaining openings are errors
+    for opener, pos in stack:
+        line, col = locate(pos)
+        errors.append({'line': line, 'col': col, 'len': 1, 'msg': f"Unmatched opening '{opener}'", 'pos': pos})
+
+    state = LintState(text, errors, newlines, found, control_found, token_found,
+                      offsets, checkpoints)
+    return errors, state
+
+
+class _LintSignals(QObject):
+    # (generation, errors, LintState) posted back to the GUI thread
+    finished = pyqtSignal(int, object, object)
+
+
+class LintWorker(QRunnable):
+    """Runs lint_gsc_incremental on a text snapshot in the global thread pool."""
+
+    def __init__(self, text: str, generation: int, signals: _LintSignals, previous: LintState = None):
+        super().__init__()
+        self.text = text
+        self.generation = generation
+        self.signals = signals
+        self.previous = previous
+
+    def run(self):
+        try:
+            errors, state = lint_gsc_incremental(self.text, self.previous)
+        except Exception as e:
+            _handle_suppressed(e)
+            return
+        self.signals.finished.emit(self.generation, errors, state)
+
+
+def _decode_script(data: bytes) -> str:
+    """Decode a script file the same way for every open path.
+
+    Strict UTF-8 with universal newlines, as text-mode open() gives; raises
+    ValueError with a user-facing reason for binary or non-UTF-8 data.
+    """
+    if b'\x00' in data:
+        raise ValueError("File appears to be binary")
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise ValueError(f"File is not valid UTF-8 ({e})")
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+class FileLoader(QThread):
+    """Reads a large file in chunks off the GUI thread."""
+
+    # (filename, text) on success; (filename, reason) when the file is refused
+    loaded = pyqtSignal(str, str)
+    failed = pyqtSignal(str, str)
+
+    _CHUNK = 64 * 1024
+
+    def __init__(self, filename: str, parent=None):
+        super().__init__(parent)
+        self.filename = filename
+
+    def run(self):
+        chunks = []
+        try:
+            with open(self.filename, 'rb') as f:
+                while True:
+                    chunk = f.read(self._CHUNK)
+                    if not chunk:
+                        break
+                    # NUL bytes do not occur in scripts: stop before reading the rest
+                    if chunk.find(b'\x00') >= 0:
+                        self.failed.emit(self.filename, "File appears to be binary")
+                        return
+                    chunks.append(chunk)
+        except OSError as e:
+            self.failed.emit(self.filename, str(e))
+            return
+        try:
+            text = _decode_script(b''.join(chunks))
+        except ValueError as e:
+            self.failed.emit(self.filename, str(e))
+            return
+        self.loaded.emit(self.filename, text)
+
+
+class SettingsWriter(QThread):
+    """Applies queued QSettings writes on a worker thread."""
+
+    # sync to the backing store at least this often while draining a long queue
+    _SYNC_EVERY = 16
+
+    def __init__(self, organization: str, application: str, parent=None):
+        super().__init__(parent)
+        self._organization = organization
+        self._application = application
+        self._queue = deque()
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._stopping = False
+
+    def enqueue(self, key, value):
+        self._mutex.lock()
+        try:
+            self._queue.append((key, value))
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+
+    def stop(self):
+        """Drain pending writes, sync, and join the thread."""
+        self._mutex.lock()
+        try:
+            self._stopping = True
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+        self.wait()
+
+    def run(self):
+        # QSettings objects must not be shared across threads; this one is private
+        settings = QSettings(self._organization, self._application)
+        while True:
+            self._mutex.lock()
+            try:
+                while not self._queue and not self._stopping:
+                    self._wake.wait(self._mutex)
+                batch = list(self._queue)
+                self._queue.clear()
+                stopping = self._stopping
+            finally:
+                self._mutex.unlock()
+            try:
+                for n, (key, value) in enumerate(batch, 1):
+                    settings.setValue(key, value)
+                    if n % self._SYNC_EVERY == 0:
+                        settings.sync()
+                if batch:
+                    settings.sync()
+            except Exception as e:
+                _handle_suppressed(e)
+            if stopping:
+                return
+
+
+class AutosaveWriter(QThread):
+    """Writes serialized autosave files on a worker thread.
+
+    Jobs are keyed by path, so a newer write (or removal) of a file that is
+    still queued replaces the older one; appends are merged into it.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs = {}  # path -> (append, bytes), or None to remove the file
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._stopping = False
+
+    def enqueue(self, path: str, blob):
+        self._mutex.lock()
+        try:
+            # re-insert so the job moves behind everything queued before it
+            self._jobs.pop(path, None)
+            self._jobs[path] = None if blob is None else (False, blob)
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+
+    def append(self, path: str, blob: bytes):
+        self._mutex.lock()
+        try:
+            job = self._jobs.pop(path, self)
+            if job is self:
+                job = (True, blob)
+            elif job is None:
+                job = (False, blob)  # removed first: start a fresh file
+            else:
+                job = (job[0], job[1] + blob)
+            self._jobs[path] = job
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+
+    def stop(self):
+        """Finish pending writes and join the thread."""
+        self._mutex.lock()
+        try:
+            self._stopping = True
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+        self.wait()
+
+    def run(self):
+        while True:
+            self._mutex.lock()
+            try:
+                while not self._jobs and not self._stopping:
+                    self._wake.wait(self._mutex)
+                jobs = self._jobs
+                self._jobs = {}
+                stopping = self._stopping
+            finally:
+                self._mutex.unlock()
+            for path, job in jobs.items():
+                try:
+                    if job is None:
+                        _remove_if_exists(path)
+                    elif job[0]:
+                        with open(path, 'ab') as f:
+                            f.write(job[1])
+                    else:
+                        _write_atomic(path, job[1])
+                except Exception as e:
+                    _handle_suppressed(e)
+            if stopping:
+                return
+
+
+class AutosaveLog:
+    """Edits made to an editor since its last autosave snapshot."""
+
+    def __init__(self, gen, length):
+        self.gen = gen  # snapshot generation the records apply to
+        self.length = length  # document length (UTF-16 units) after the logged edits
+        self.pending = []  # encoded records not yet handed to the writer
+        self.logged = 0  # bytes appended to the .wal since the snapshot
+        self.broken = False  # an edit could not be logged: the next save must snapshot
+
+
+class CachedSettings:
+    """QSettings front that serves reads from memory and skips no-op writes.
+
+    With a SettingsWriter attached, writes are queued to it instead of
+    touching the backing store on the calling thread.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, settings: QSettings, writer: SettingsWriter = None):
+        self._settings = settings
+        self._writer = writer
+        self._cache = {}
+
+    def value(self, key, default=None):
+        cached = self._cache.get(key, self._MISSING)
+        if cached is self._MISSING:
+            if self._settings.contains(key):
+                cached = self._settings.value(key)
+            self._cache[key] = cached
+        if cached is self._MISSING:
+            return default
+        # hand out copies of lists so callers cannot mutate the cache in place
+        return list(cached) if isinstance(cached, list) else cached
+
+    def setValue(self, key, value):
+        if isinstance(value, list):
+            value = list(value)
+        if self._cache.get(key, self._MISSING) == value:
+            return
+        self._cache[key] = value
+        if self._writer is not None:
+            self._writer.enqueue(key, value)
+        else:
+            self._settings.setValue(key, value)
+
+    def close(self):
+        """Flush queued writes and stop the writer; later writes go direct."""
+        if self._writer is not None:
+            self._writer.stop()
+            self._writer = None
+        self._settings.sync()
+
+
 class GSCIDEWindow(QMainWindow):
+    # files above this size are read by a FileLoader thread
+    _ASYNC_OPEN_BYTES = 256 * 1024
+    # lint errors listed/underlined at once; the rest are summarised as "+N more"
+    _LINT_MAX_SHOWN = 200
+    # an edit log is compacted into a new snapshot once it outgrows the document (or this)
+    _WAL_COMPACT_MIN = 64 * 1024
+
+    # Caps Lock label styles: (text, stylesheet) per state
+    _CAPS_ON = ("CAPS ON", "padding:2px 6px; border-radius:4px; background:#b22222; color:#fff; font-weight:bold;")
+    _CAPS_OFF_DARK = ("CAPS OFF", "padding:2px 6px; border-radius:4px; background: transparent; color:#fff; font-weight:bold;")
+    _CAPS_OFF_LIGHT = ("CAPS OFF", "padding:2px 6px; border-radius:4px; background: transparent; color:#000; font-weight:bold;")
+
+    # Window stylesheets, one per theme
+    DARK_CSS = """
+    QMainWindow { background-color: #151718; }
+    QLabel { color: #e6eef3; }
+    QComboBox, QLineEdit { background-color: #232526; color: #e6eef3; border: 1px solid #3a3d3f; padding: 6px; border-radius: 6px; }
+    QPushButton { background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #0b78c0, stop:1 #0961a8); color: white; border:none; padding:8px 12px; border-radius:6px; }
+    QPushButton:hover { background-color: #0f8ee0; }
+    QPlainTextEdit, QTextEdit { background-color: #0f1314; color: #dbe9ee; border: 1px solid #2f3334; }
+    QGroupBox { color: #e6eef3; border: 1px solid #2f3334; border-radius: 8px; margin-top: 12px; padding-top: 12px; }
+    QGroupBox::title { subcontrol-origin: margin; left: 12px; padding: 0 8px; }
+    QMenuBar { background: #171919; color: #e6eef3; }
+    QMenuBar::item:selected { background: #1f8bbf; }
+    QMenu { background: #171919; color: #e6eef3; border: 1px solid #2f3334; }
+    QMenu::item:selected { background: #0f6aa0; }
+    QStatusBar { background: #0f6aa0; color: white; }
+    /* Editor gutter */
+    QWidget#lineNumberArea { background: #0d1111; }
+    """
+
+    LIGHT_CSS = """
+    QMainWindow { background-color: #f3f6f8; }
+    QLabel { color: #1b1f23; }
+    QComboBox, QLineEdit { background-color: #ffffff; color: #1b1f23; border: 1px solid #cfd8dc; }
+    QPlainTextEdit, QTextEdit { background-color: #ffffff; color: #1b1f23; border: 1px solid #d0d7db; }
+    QGroupBox { color: #1b1f23; border: 1px solid #d0d7db; }
+    QStatusBar { background-color: #e0e7ea; color: #1b1f23; }
+    """
+
     def __init__(self):
         super().__init__()
         self.current_file = None
         self.injection_manager = InjectionManager()
-        self.settings = QSettings("GSC-IDE", "GSCIDE")
+        # settings writes are applied by a background thread (see SettingsWriter)
+        self.settings_writer = SettingsWriter("GSC-IDE", "GSCIDE", self)
+        self.settings_writer.start()
+        self.settings = CachedSettings(QSettings("GSC-IDE", "GSCIDE"), self.settings_writer)
+        # live-lint flag read once; schedule_live_lint runs on every keystroke
+        self._lint_live = _as_bool(self.settings.value('lint_live', True), True)
+        # background lint bookkeeping: results from older generations are dropped
+        self._lint_generation = 0
+        self._lint_editor = None
+        self._lint_signals = _LintSignals(self)
+        self._lint_signals.finished.connect(self._on_background_lint_finished)
+        # editor -> LintState of its last linted snapshot, for incremental relints
+        self._lint_states = WeakKeyDictionary()
+        # recent files kept in memory; the menu is rebuilt only when they change
+        self._recent = None
+        self._recent_dirty = True
+        # QStyle.StandardPixmap -> QIcon, filled on first use (see _icon)
+        self._std_icons = {}
+        # last state shown by update_game_status (None until the first check)
+        self._last_game_running = None
+        # last game-status error logged, so the 2 s poll reports each one once
+        self._last_game_error = None
+        # edited editors wait here until one shared debounce timer saves them
+        self._autosave_dirty = WeakSet()
+        # editor -> AutosaveLog; edits between snapshots are appended to a .wal file
+        self._autosave_wal = WeakKeyDictionary()
+        self._autosave_gens = count(1)
+        # snapshot paths of editors collected without remove_autosave_for; filled
+        # by finalizers on whatever thread ran the GC, drained on the GUI thread
+        self._orphaned_autosaves = SimpleQueue()
+        self._autosave_sweep = QTimer(self)
+        self._autosave_sweep.setSingleShot(True)
+        self._autosave_sweep.setInterval(3000)
+        self._autosave_sweep.timeout.connect(self._autosave_sweep_cb)
+        # cursor position labels refresh at most once per frame
+        self._cursor_update_timer = QTimer(self)
+        self._cursor_update_timer.setSingleShot(True)
+        self._cursor_update_timer.setInterval(16)
+        self._cursor_update_timer.timeout.connect(self._do_update_cursor_info)
+        # set in init_ui; eventFilter may see events before that
+        self._find_widget = None
+        # theme/font writes coalesce here; flushed 500 ms after the last change
+        self._pending_settings = {}
+        self._settings_flush_timer = QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setInterval(500)
+        self._settings_flush_timer.timeout.connect(self._flush_deferred_settings)
         
         self.init_ui()
         self.setup_timer()
@@ -398,27 +1205,7 @@ class GSCIDEWindow(QMainWindow):
         self.setWindowTitle("GSC IDE - Call of Duty Script Editor (Plutonium)")
         self.setGeometry(100, 100, 1400, 900)
         
-        # Set dark theme colors
-        # Base stylesheet (dark by default) - improved visuals
-        self.base_css = """
-        QMainWindow { background-color: #151718; }
-        QLabel { color: #e6eef3; }
-        QComboBox, QLineEdit { background-color: #232526; color: #e6eef3; border: 1px solid #3a3d3f; padding: 6px; border-radius: 6px; }
-        QPushButton { background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #0b78c0, stop:1 #0961a8); color: white; border:none; padding:8px 12px; border-radius:6px; }
-        QPushButton:hover { background-color: #0f8ee0; }
-        QPlainTextEdit, QTextEdit { background-color: #0f1314; color: #dbe9ee; border: 1px solid #2f3334; }
-        QGroupBox { color: #e6eef3; border: 1px solid #2f3334; border-radius: 8px; margin-top: 12px; padding-top: 12px; }
-        QGroupBox::title { subcontrol-origin: margin; left: 12px; padding: 0 8px; }
-        QMenuBar { background: #171919; color: #e6eef3; }
-        QMenuBar::item:selected { background: #1f8bbf; }
-        QMenu { background: #171919; color: #e6eef3; border: 1px solid #2f3334; }
-        QMenu::item:selected { background: #0f6aa0; }
-        QStatusBar { background: #0f6aa0; color: white; }
-        /* Editor gutter */
-        QWidget#lineNumberArea { background: #0d1111; }
-        """
-
-        self.setStyleSheet(self.base_css)
+        # Window stylesheet is applied once by apply_theme (see DARK_CSS/LIGHT_CSS)
         
         # Menu bar will be created after editor is initialized
         
@@ -441,6 +1228,7 @@ class GSCIDEWindow(QMainWindow):
 
         # Find/Replace bar (hidden by default)
         self.find_widget = QWidget()
+        self._find_widget = self.find_widget  # read by eventFilter on every key event
         self.find_widget.setStyleSheet("background-color: #1b2426; border: 1px solid #2f4448; padding:6px; border-radius:6px;")
         find_layout = QHBoxLayout(self.find_widget)
         self.find_input = QLineEdit()
@@ -468,13 +1256,22 @@ class GSCIDEWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabsClosable(True)
         self.tab_widget.tabCloseRequested.connect(lambda idx: self.close_tab(idx))
+        # highlight tabs lazily, the first time each one becomes current
+        self.tab_widget.currentChanged.connect(lambda idx: self._ensure_highlighter(self.tab_widget.widget(idx)))
 
         # create initial editor tab
         self.editor = GSCEditor()
         # map editor widget -> filename (use WeakKeyDictionary to avoid leaking editor objects)
         self.tab_paths = WeakKeyDictionary()
+        # editor -> display name for the status label, kept in step with tab_paths
+        self.tab_basenames = WeakKeyDictionary()
+        # editor -> (st_size, st_mtime_ns) of its file when last loaded or saved
+        self._tab_stat = WeakKeyDictionary()
+        # editor -> plain text reused by repeated Find Previous; dropped on edit
+        self._find_text_cache = WeakKeyDictionary()
         self.tab_widget.addTab(self.editor, "Untitled")
-        self.tab_paths[self.editor] = None
+        self._set_tab_path(self.editor, None)
+        self._ensure_highlighter(self.editor)
         vertical_splitter.addWidget(self.tab_widget)
 
         # attach signals for the initial editor
@@ -487,14 +1284,21 @@ class GSCIDEWindow(QMainWindow):
             self.autosave_index = os.path.join(self.autosave_dir, 'index.json')
             # check for recovery files
             self.check_autosave_recovery()
+            # autosave files are serialized here and written by a worker thread
+            self.autosave_writer = AutosaveWriter(self)
+            self.autosave_writer.start()
             self.autosave_timer = QTimer(self)
-            self.autosave_timer.setInterval(10000)  # 10s
+            # safety net only: edits are saved by the debounced sweep (see _mark_autosave_dirty)
+            self.autosave_timer.setInterval(60000)  # 60s
             self.autosave_timer.timeout.connect(self.autosave_all)
             self.autosave_timer.start()
-            # per-editor autosave timers map
             # use weak-keyed dicts so editors can be garbage collected when tabs close
-            self._autosave_timers = WeakKeyDictionary()
             self.autosave_map = WeakKeyDictionary()  # editor -> autosave filename
+            self._autosave_fp = WeakKeyDictionary()  # editor -> (filename, hash) of last autosaved text
+            self._autosave_finalizers = WeakKeyDictionary()  # editor -> finalize (see _drop_orphaned_autosaves)
+            # records in the index file written by this session; None until the
+            # first write, which replaces whatever a previous session left
+            self._autosave_index_lines = None
         except Exception as e:
             try:
                 self.log_exception("autosave setup", e)
@@ -553,7 +1357,7 @@ class GSCIDEWindow(QMainWindow):
             self.live_lint_timer = QTimer(self)
             self.live_lint_timer.setSingleShot(True)
             self.live_lint_timer.setInterval(500)  # 500ms debounce
-            self.live_lint_timer.timeout.connect(self.lint_script)
+            self.live_lint_timer.timeout.connect(self.start_background_lint)
         except Exception as e:
             try:
                 self.log_exception("live_lint_timer setup", e)
@@ -572,9 +1376,11 @@ class GSCIDEWindow(QMainWindow):
         replace_btn.clicked.connect(lambda: self.replace_one())
         close_find_btn.clicked.connect(lambda: self.find_widget.setVisible(False))
 
-        # Install event filter to catch Escape key to close find widget
+        # Install an application-wide event filter: Caps Lock changes are seen
+        # whichever widget has focus, and Escape closes the find widget from an
+        # editor. eventFilter returns early for anything that is not a key event.
         try:
-            self.tab_widget.installEventFilter(self)
+            QApplication.instance().installEventFilter(self)
         except Exception as e:
             try:
                 self.log_exception("installEventFilter", e)
@@ -708,19 +1514,22 @@ class GSCIDEWindow(QMainWindow):
                 _handle_suppressed(e, locals().get('self', None))
         self.statusBar.showMessage("Ready")
 
-        # Apply saved theme (dark/light)
+        # Apply saved theme (dark/light) once the event loop runs, i.e. after
+        # show(): the widget tree is polished once for real instead of
+        # restyled while it is still being laid out
         self.current_theme = self.settings.value('theme', 'dark')
-        self.apply_theme(self.current_theme)
+        QTimer.singleShot(0, lambda: self.apply_theme(self.current_theme))
 
         # Caps Lock indicator (always show ON/OFF and adapt to theme)
         try:
             self.caps_label = QLabel("")
             # color will be adjusted in update_caps_lock based on theme
-            self.caps_label.setStyleSheet("padding:2px 6px; border-radius:4px; background: transparent; color: #fff; font-weight: bold;")
+            self.caps_label.setStyleSheet(self._CAPS_OFF_DARK[1])
             self.statusBar.addPermanentWidget(self.caps_label)
             self.caps_timer = QTimer()
             self.caps_timer.timeout.connect(self.update_caps_lock)
-            self.caps_timer.start(300)
+            # slow idle poll; key events update the label immediately (see eventFilter)
+            self.caps_timer.start(1000)
             # set initial state
             self.update_caps_lock()
         except Exception as e:
@@ -752,20 +1561,23 @@ class GSCIDEWindow(QMainWindow):
         file_menu.addAction(save_action)
         
         save_as_action = QAction("Save As...", self)
-        save_as_action.setShortcut(QKeySequence("Ctrl+Shift+S"))
+        save_as_action.setShortcut(_KS_SAVE_AS)
         save_as_action.triggered.connect(self.save_file_as)
         file_menu.addAction(save_as_action)
         
         # Recent files submenu (populated from QSettings)
         self.recent_menu = file_menu.addMenu("Open Recent")
-        # populate after menu creation
-        # items are managed via self.update_recent_menu()
-        self.update_recent_menu()
         
-        # Quick clear recent shortcut
+        # Quick clear recent shortcut; the recent submenu reuses this action
         clear_recent_shortcut = QAction("Clear Recent", self)
-        clear_recent_shortcut.setShortcut(QKeySequence("Ctrl+Shift+R"))
+        clear_recent_shortcut.setShortcut(_KS_CLEAR_RECENT)
         clear_recent_shortcut.triggered.connect(self.clear_recent_files)
+        self._clear_recent_act = clear_recent_shortcut
+        
+        # populate now, then rebuild lazily when the list changed and the menu opens
+        # items are managed via self.update_recent_menu()
+        self.update_recent_menu()
+        self.recent_menu.aboutToShow.connect(self.update_recent_menu)
         file_menu.addAction(clear_recent_shortcut)
         self.addAction(clear_recent_shortcut)
         
@@ -810,7 +1622,7 @@ class GSCIDEWindow(QMainWindow):
         gsc_menu = menubar.addMenu("GSC")
         
         inject_action = QAction("Deploy Script", self)
-        inject_action.setShortcut(QKeySequence("F5"))
+        inject_action.setShortcut(_KS_DEPLOY)
         inject_action.triggered.connect(self.deploy_script)
         gsc_menu.addAction(inject_action)
         
@@ -823,7 +1635,7 @@ class GSCIDEWindow(QMainWindow):
         
         # Preferences
         prefs_action = QAction("Preferences...", self)
-        prefs_action.setShortcut(QKeySequence("Ctrl+,"))
+        prefs_action.setShortcut(_KS_PREFERENCES)
         prefs_action.triggered.connect(self.open_preferences)
         file_menu.addAction(prefs_action)
         self.addAction(prefs_action)
@@ -838,14 +1650,14 @@ class GSCIDEWindow(QMainWindow):
         self.addAction(find_action)
 
         replace_action = QAction("Replace", self)
-        replace_action.setShortcut(QKeySequence("Ctrl+H"))
+        replace_action.setShortcut(_KS_REPLACE)
         replace_action.triggered.connect(lambda: self.show_find(False))
         edit_menu.addAction(replace_action)
 
         # Find Previous action
         try:
             find_prev_action = QAction("Find Previous", self)
-            find_prev_action.setShortcut(QKeySequence("Shift+F3"))
+            find_prev_action.setShortcut(_KS_FIND_PREVIOUS)
             find_prev_action.triggered.connect(lambda: self.find_previous())
             edit_menu.addAction(find_prev_action)
             self.addAction(find_prev_action)
@@ -860,12 +1672,10 @@ class GSCIDEWindow(QMainWindow):
         # View menu (toggle panels)
         view_menu = menubar.addMenu("View")
         # Injection panel visibility (persisted)
-        injection_vis = self.settings.value('panel_injection', True)
-        if isinstance(injection_vis, str):
-            injection_vis = injection_vis.lower() in ('1', 'true', 'yes', 'on')
+        injection_vis = _as_bool(self.settings.value('panel_injection', True), True)
         toggle_injection = QAction("Toggle Injection Panel", self, checkable=True)
-        toggle_injection.setChecked(bool(injection_vis))
-        toggle_injection.setShortcut(QKeySequence("Ctrl+Shift+I"))
+        toggle_injection.setChecked(injection_vis)
+        toggle_injection.setShortcut(_KS_TOGGLE_INJECTION)
         def _set_injection(checked):
             self.injection_group.setVisible(checked)
             try:
@@ -878,12 +1688,10 @@ class GSCIDEWindow(QMainWindow):
         toggle_injection.triggered.connect(_set_injection)
         view_menu.addAction(toggle_injection)
 
-        output_vis = self.settings.value('panel_output', True)
-        if isinstance(output_vis, str):
-            output_vis = output_vis.lower() in ('1', 'true', 'yes', 'on')
+        output_vis = _as_bool(self.settings.value('panel_output', True), True)
         toggle_output = QAction("Toggle Output Panel", self, checkable=True)
-        toggle_output.setChecked(bool(output_vis))
-        toggle_output.setShortcut(QKeySequence("Ctrl+Shift+O"))
+        toggle_output.setChecked(output_vis)
+        toggle_output.setShortcut(_KS_TOGGLE_OUTPUT)
         def _set_output(checked):
             self.output_group.setVisible(checked)
             try:
@@ -898,7 +1706,7 @@ class GSCIDEWindow(QMainWindow):
 
         # Theme toggle
         theme_action = QAction("Toggle Theme", self)
-        theme_action.setShortcut(QKeySequence("Ctrl+T"))
+        theme_action.setShortcut(_KS_TOGGLE_THEME)
         theme_action.triggered.connect(self.toggle_theme)
         view_menu.addAction(theme_action)
 
@@ -907,31 +1715,34 @@ class GSCIDEWindow(QMainWindow):
         self.addAction(toggle_output)
         self.addAction(theme_action)
 
-        # Toolbar for quick actions
+        # Toolbar for quick actions, built from (label, icon, tooltip, shortcut, slot) specs
         toolbar = self.addToolBar("Main")
-        new_act = QAction("New", self)
-        new_act.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon))
-        new_act.setToolTip("New file (Ctrl+N)")
-        new_act.triggered.connect(self.new_file)
-        toolbar.addAction(new_act)
-
-        open_act = QAction("Open", self)
-        open_act.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon))
-        open_act.setToolTip("Open file (Ctrl+O)")
-        open_act.triggered.connect(self.open_file)
-        toolbar.addAction(open_act)
-
-        save_act = QAction("Save", self)
-        save_act.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton))
-        save_act.setToolTip("Save file (Ctrl+S)")
-        save_act.triggered.connect(self.save_file)
-        toolbar.addAction(save_act)
+        SP = QStyle.StandardPixmap
+        self._toolbar_actions = {}
+
+        def add_toolbar_actions(spec):
+            for label, pixmap, tip, shortcut, slot in spec:
+                act = QAction(label, self)
+                if pixmap is not None:
+                    act.setIcon(self._icon(pixmap))
+                act.setToolTip(tip)
+                if shortcut is not None:
+                    act.setShortcut(shortcut)
+                act.triggered.connect(slot)
+                toolbar.addAction(act)
+                self._toolbar_actions[label] = act
+
+        add_toolbar_actions((
+            ("New", SP.SP_FileIcon, "New file (Ctrl+N)", None, self.new_file),
+            ("Open", SP.SP_DirOpenIcon, "Open file (Ctrl+O)", None, self.open_file),
+            ("Save", SP.SP_DialogSaveButton, "Save file (Ctrl+S)", None, self.save_file),
+        ))
 
         toolbar.addSeparator()
 
         # Reuse the Find/Replace actions already created for the Edit menu
         try:
-            find_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView))
+            find_action.setIcon(self._icon(QStyle.StandardPixmap.SP_FileDialogContentsView))
             find_action.setToolTip("Find (Ctrl+F)")
             toolbar.addAction(find_action)
         except Exception as e:
@@ -941,7 +1752,7 @@ class GSCIDEWindow(QMainWindow):
                 _handle_suppressed(e, locals().get('self', None))
 
         try:
-            replace_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
+            replace_action.setIcon(self._icon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
             replace_action.setToolTip("Replace (Ctrl+H)")
             toolbar.addAction(replace_action)
         except Exception as e:
@@ -953,7 +1764,7 @@ class GSCIDEWindow(QMainWindow):
             # Add Find Previous to toolbar for quick access
             if getattr(self, 'find_prev_btn', None) is None:
                 find_prev_action = QAction("Find Previous", self)
-                find_prev_action.setShortcut(QKeySequence("Shift+F3"))
+                find_prev_action.setShortcut(_KS_FIND_PREVIOUS)
                 find_prev_action.triggered.connect(lambda: self.find_previous())
                 find_prev_action.setToolTip("Find Previous (Shift+F3)")
                 toolbar.addAction(find_prev_action)
@@ -965,38 +1776,61 @@ class GSCIDEWindow(QMainWindow):
 
         toolbar.addSeparator()
 
-        deploy_act = QAction("Deploy", self)
-        deploy_act.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
-        deploy_act.setToolTip("Deploy script to Plutonium (F5)")
-        deploy_act.setShortcut(QKeySequence("F5"))
-        deploy_act.triggered.connect(self.deploy_script)
-        toolbar.addAction(deploy_act)
+        add_toolbar_actions((
+            ("Deploy", SP.SP_MediaPlay, "Deploy script to Plutonium (F5)", _KS_DEPLOY, self.deploy_script),
+        ))
 
         # Font size controls
         toolbar.addSeparator()
-        inc_font = QAction("A+", self)
-        inc_font.setToolTip("Increase editor font size")
-        inc_font.triggered.connect(lambda: self.set_editor_font_size(1))
-        toolbar.addAction(inc_font)
-
-        dec_font = QAction("A-", self)
-        dec_font.setToolTip("Decrease editor font size")
-        dec_font.triggered.connect(lambda: self.set_editor_font_size(-1))
-        toolbar.addAction(dec_font)
-        # Tab actions
-        close_tab_act = QAction("Close Tab", self)
-        close_tab_act.setShortcut(QKeySequence("Ctrl+W"))
-        close_tab_act.triggered.connect(lambda: self.close_tab(self.tab_widget.currentIndex()))
-        self.addAction(close_tab_act)
-        toolbar.addAction(close_tab_act)
+        add_toolbar_actions((
+            ("A+", None, "Increase editor font size", None, lambda: self.set_editor_font_size(1)),
+            ("A-", None, "Decrease editor font size", None, lambda: self.set_editor_font_size(-1)),
+            # Tab actions
+            ("Close Tab", None, "Close Tab", _KS_CLOSE_TAB, lambda: self.close_tab(self.tab_widget.currentIndex())),
+        ))
+        # window-wide so the shortcut works even when the toolbar is hidden
+        self.addAction(self._toolbar_actions["Close Tab"])
     
+    def _icon(self, pixmap: QStyle.StandardPixmap) -> QIcon:
+        """Standard style icon, created once and reused."""
+        icon = self._std_icons.get(pixmap)
+        if icon is None:
+            icon = self._std_icons[pixmap] = self.style().standardIcon(pixmap)
+        return icon
+
     def setup_timer(self):
         # Update game status every 2 seconds
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_game_status)
-        # Also refresh Plutonium install detection periodically
-        self.timer.timeout.connect(self.update_plutonium_path)
         self.timer.start(2000)
+        # Plutonium install detection is refreshed on filesystem changes, not polled
+        try:
+            self._plut_watcher = QFileSystemWatcher(self)
+            self._plut_watcher.directoryChanged.connect(self._on_plutonium_dir_changed)
+            self._watch_plutonium_dirs()
+        except Exception as e:
+            try:
+                self.log_exception("plutonium watcher setup", e)
+            except Exception as e:
+                _handle_suppressed(e, locals().get('self', None))
+
+    def _watch_plutonium_dirs(self):
+        """Watch %localappdata% and, once it exists, its Plutonium folder."""
+        localappdata = os.getenv('LOCALAPPDATA')
+        if not localappdata:
+            return
+        watched = set(self._plut_watcher.directories())
+        for d in (localappdata, os.path.join(localappdata, 'Plutonium')):
+            if d not in watched and os.path.isdir(d):
+                self._plut_watcher.addPath(d)
+
+    def _on_plutonium_dir_changed(self, _path):
+        try:
+            self._watch_plutonium_dirs()
+            self.injection_manager.invalidate_plutonium_path()
+        except Exception as e:
+            _handle_suppressed(e, locals().get('self', None))
+        self.update_plutonium_path()
 
     def log_exception(self, context: str, exc: Exception):
         try:
@@ -1020,7 +1854,27 @@ class GSCIDEWindow(QMainWindow):
                 except Exception as e:
                     _handle_suppressed(e, locals().get('self', None))
 
+    def _set_tab_path(self, editor, filename):
+        """Record the file behind a tab along with its display name."""
+        self.tab_paths[editor] = filename
+        self.tab_basenames[editor] = os.path.basename(filename) if filename else "Untitled"
+
+    def _record_tab_stat(self, editor, filename):
+        """Remember the on-disk state of a file the editor now matches."""
+        try:
+            st = os.stat(filename)
+            self._tab_stat[editor] = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            self._tab_stat.pop(editor, None)
+
     def update_cursor_info(self):
+        """Coalesce bursts of cursor moves into one label refresh."""
+        try:
+            self._cursor_update_timer.start()
+        except Exception:
+            self._do_update_cursor_info()
+
+    def _do_update_cursor_info(self):
         try:
             editor = self.current_editor()
             if editor is None:
@@ -1031,7 +1885,7 @@ class GSCIDEWindow(QMainWindow):
             self.editor_info.setText(f"Line: {line} | Column: {column}")
             # Update small status label with current file and position
             try:
-                file_display = os.path.basename(self.tab_paths.get(editor)) if self.tab_paths.get(editor) else "Untitled"
+                file_display = self.tab_basenames.get(editor, "Untitled")
                 if hasattr(self, 'status_label'):
                     self.status_label.setText(f"{file_display} — Ln {line}, Col {column}")
             except Exception as e:
@@ -1047,11 +1901,10 @@ class GSCIDEWindow(QMainWindow):
 
     def schedule_live_lint(self):
         """Start or restart the debounced live-lint timer if enabled in settings."""
+        # runs on every edit: a lint still in flight describes older text, drop its result
+        self._lint_generation += 1
         try:
-            lint_live = self.settings.value('lint_live', True)
-            if isinstance(lint_live, str):
-                lint_live = lint_live.lower() in ('1', 'true', 'yes', 'on')
-            if not lint_live:
+            if not self._lint_live:
                 return
             # restart timer
             try:
@@ -1073,6 +1926,10 @@ class GSCIDEWindow(QMainWindow):
                 self.log_exception("attach_editor_signals: cursorPositionChanged", e)
             except Exception as e:
                 _handle_suppressed(e, locals().get('self', None))
+        try:
+            editor.textChanged.connect(lambda ed=editor: self._find_text_cache.pop(ed, None))
+        except Exception as e:
+            _handle_suppressed(e, locals().get('self', None))
         try:
             editor.textChanged.connect(self.schedule_live_lint)
         except Exception as e:
@@ -1080,30 +1937,20 @@ class GSCIDEWindow(QMainWindow):
                 self.log_exception("attach_editor_signals: textChanged", e)
             except Exception as e:
                 _handle_suppressed(e, locals().get('self', None))
-        # per-editor autosave timer: debounce rapid edits
-        try:
-            if getattr(self, 'autosave_dir', None):
-                t = QTimer(self)
-                t.setSingleShot(True)
-                t.setInterval(3000)
-                # capture editor in lambda default
-                t.timeout.connect(lambda ed=editor: self.autosave_editor(ed))
-                self._autosave_timers[editor] = t
-                # when text changes, start/reset timer
-                def _on_edit():
-                    try:
-                        timer = self._autosave_timers.get(editor)
-                        if timer:
-                            timer.start()
-                    except Exception as e:
-                        try:
-                            self.log_exception("autosave _on_edit", e)
-                        except Exception as e:
-                            _handle_suppressed(e, locals().get('self', None))
-                editor.textChanged.connect(_on_edit)
+        # autosave: mark dirty and (re)start the shared debounce timer
+        try:
+            editor.textChanged.connect(lambda ed=editor: self._mark_autosave_dirty(ed))
+        except Exception as e:
+            try:
+                self.log_exception("attach_editor_signals: autosave", e)
+            except Exception as e:
+                _handle_suppressed(e, locals().get('self', None))
+        try:
+            editor.document().contentsChange.connect(
+                lambda pos, removed, added, ed=editor: self._record_autosave_change(ed, pos, removed, added))
         except Exception as e:
             try:
-                self.log_exception("attach_editor_signals (autosave setup)", e)
+                self.log_exception("attach_editor_signals: contentsChange", e)
             except Exception as e:
                 _handle_suppressed(e, locals().get('self', None))
 
@@ -1127,80 +1974,49 @@ class GSCIDEWindow(QMainWindow):
 
     # --- Linting ---
     def lint_script(self):
-        """Simple GSC linter: unmatched brackets/parentheses and unterminated strings.
-        Produces precise character positions and underlines problematic ranges in the editor.
+        """Lint the current editor synchronously and mark problems in it.
+        Returns True when no issues were found.
         """
         editor = self.current_editor()
         if editor is None:
             return True
-        text = editor.toPlainText()
-        lines = text.splitlines()
-        stack = []  # tuples (char, line, col)
-        errors = []  # list of dicts: {line, col, len, msg}
-        pos_list = []
+        # supersede any background lint still in flight
+        self._lint_generation += 1
+        errors, self._lint_states[editor] = lint_gsc_incremental(editor.toPlainText(), self._lint_states.get(editor))
+        return self.apply_lint_results(editor, errors)
 
-        in_string = False
-        string_char = None
-        string_start_line = None
-        string_start_col = None
-
-        pairs = {'}': '{', ')': '(', ']': '['}
-
-        for i, line in enumerate(lines, start=1):
-            # Quick checks: control/non-printable characters and suspicious tokens
-            try:
-                for ci, ch in enumerate(line):
-                    if unicodedata.category(ch) == 'Cc' and ch not in ('\t', '\n', '\r'):
-                        errors.append({'line': i, 'col': ci, 'len': 1, 'msg': 'Control/non-printable character detected'})
-                        break
-            except Exception as e:
-                _handle_suppressed(e, locals().get('self', None))
-            try:
-                # suspicious token heuristic: tokens with length>=4 but zero alphabetic chars
-                toks = re.findall(r"\S+", line)
-                for t in toks:
-                    if len(t) >= 4:
-                        alpha_count = sum(1 for c in t if c.isalpha())
-                        non_ascii = sum(1 for c in t if ord(c) > 127)
-                        if alpha_count == 0 or non_ascii > (len(t) // 2):
-                            col = line.find(t)
-                            errors.append({'line': i, 'col': col if col >= 0 else 0, 'len': max(1, len(t)), 'msg': 'Suspicious token or non-ASCII text'})
-                            break
-            except Exception as e:
-                _handle_suppressed(e, locals().get('self', None))
-            j = 0
-            while j < len(line):
-                ch = line[j]
-                # naive escape handling: if previous char is backslash, skip special handling
-                prev = line[j-1] if j > 0 else ''
-                if ch in ('"', "'") and prev != '\\':
-                    if not in_string:
-                        in_string = True
-                        string_char = ch
-                        string_start_line = i
-                        string_start_col = j
-                    elif ch == string_char:
-                        in_string = False
-                        string_char = None
-                        string_start_line = None
-                        string_start_col = None
-                elif not in_string:
-                    if ch in ('{', '(', '['):
-                        stack.append((ch, i, j))
-                    elif ch in ('}', ')', ']'):
-                        if stack and stack[-1][0] == pairs[ch]:
-                            stack.pop()
-                        else:
-                            errors.append({'line': i, 'col': j, 'len': 1, 'msg': f"Unmatched closing '{ch}'"})
-                j += 1
-
-        if in_string and string_start_line is not None:
-            errors.append({'line': string_start_line, 'col': string_start_col, 'len': 1, 'msg': 'Unterminated string literal'})
-
-        # any remaining openings are errors
-        for opener, line_no, col in stack:
-            errors.append({'line': line_no, 'col': col, 'len': 1, 'msg': f"Unmatched opening '{opener}'"})
+    def start_background_lint(self):
+        """Snapshot the current editor and lint it on a worker thread."""
+        editor = self.current_editor()
+        if editor is None:
+            return
+        self._lint_generation += 1
+        self._lint_editor = editor
+        worker = LintWorker(editor.toPlainText(), self._lint_generation, self._lint_signals,
+                            self._lint_states.get(editor))
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_background_lint_finished(self, generation, errors, state):
+        # drop results superseded by a newer edit/lint or for a tab no longer shown
+        if generation != self._lint_generation:
+            return
+        editor = self._lint_editor
+        if editor is None:
+            return
+        # the state matches the snapshot whatever tab is shown now
+        self._lint_states[editor] = state
+        if editor is not self.current_editor():
+            return
+        try:
+            self.apply_lint_results(editor, errors)
+        except Exception as e:
+            _handle_suppressed(e, locals().get('self', None))
 
+    def apply_lint_results(self, editor: GSCEditor, errors):
+        """Show lint errors in the console and underline them in the editor.
+        Returns True when there are no errors.
+        """
+        pos_list = []
         # display results and mark in editor
         if not errors:
             self.error_console.setHtml('<span style="color:#9bd39b;">No lint issues found.</span>')
@@ -1214,6 +2030,16 @@ class GSCIDEWindow(QMainWindow):
                 _handle_suppressed(e, locals().get('self', None))
             return True
 
+        # only _LINT_MAX_SHOWN errors are listed and underlined; every extra
+        # selection costs time on each paint. Structural errors (brackets,
+        # strings) are kept ahead of the heuristic token/control hits.
+        hidden = len(errors) - self._LINT_MAX_SHOWN
+        if hidden > 0:
+            structural = [e for e in errors if e.get('msg') not in _LINT_HEURISTIC_MSGS]
+            heuristic = [e for e in errors if e.get('msg') in _LINT_HEURISTIC_MSGS]
+            errors = (structural + heuristic)[:self._LINT_MAX_SHOWN]
+            errors.sort(key=lambda e: (e.get('line', 0), e.get('col', 0)))
+
         # build clickable HTML and underline selections
         html = []
         for e in errors:
@@ -1222,58 +2048,68 @@ class GSCIDEWindow(QMainWindow):
             msg = e.get('msg', '')
             html.append(f'<a href="pos:{ln}:{col}"><span style="color:#ff9b9b;">[Ln {ln}:Col {col}] {msg}</span></a>')
 
+        if hidden > 0:
+            html.append(f'<span style="color:#ff9b9b;">+{hidden} more</span>')
         self.error_console.setHtml('<br>'.join(html))
-        # create extra selections to underline errors
+        # create extra selections to underline errors; one format serves them all
         sels = []
-        from PyQt6.QtGui import QTextCharFormat
+        fmt = QTextCharFormat()
+        try:
+            # Prefer a wave (squiggly) underline when available for error styling
+            try:
+                fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.WaveUnderline)
+            except Exception:
+                # older/some builds may expose SpellCheckUnderline or not support Wave
+                try:
+                    fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SpellCheckUnderline)
+                except Exception:
+                    fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SingleUnderline)
+            fmt.setUnderlineColor(QColor('#ff5c5c'))
+        except Exception:
+            # fallback: set background if underline unsupported
+            fmt.setBackground(QColor('#3a2b2b'))
+        doc = editor.document()
+        block_positions = None  # built on first use, only for errors without 'pos'
         for e in errors:
             ln = e.get('line', 0)
             col = e.get('col', 0)
             length = max(1, e.get('len', 1))
-            block = editor.document().findBlockByNumber(ln - 1)
-            if not block.isValid():
-                continue
-            start_pos = block.position() + col
+            # the linter reports absolute offsets; fall back to a line table
+            start_pos = e.get('pos')
+            if start_pos is None:
+                if block_positions is None:
+                    block_positions = []
+                    block = doc.firstBlock()
+                    while block.isValid():
+                        block_positions.append(block.position())
+                        block = block.next()
+                if not 0 < ln <= len(block_positions):
+                    continue
+                start_pos = block_positions[ln - 1] + col
             # collect positions for editor-level squiggle drawing
+            pos_list.append((start_pos, length))
+            # each selection needs its own cursor; only the move can fail
+            cursor = QTextCursor(doc)
             try:
-                pos_list.append((start_pos, length))
-            except Exception as e:
-                _handle_suppressed(e, locals().get('self', None))
-            try:
-                cursor = QTextCursor(editor.document())
                 cursor.setPosition(start_pos)
                 cursor.setPosition(start_pos + length, QTextCursor.MoveMode.KeepAnchor)
-                sel = QPlainTextEdit.ExtraSelection()
-                fmt = QTextCharFormat()
-                try:
-                    # Prefer a wave (squiggly) underline when available for error styling
-                    try:
-                        fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.WaveUnderline)
-                    except Exception:
-                        # older/some builds may expose SpellCheckUnderline or not support Wave
-                        try:
-                            fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SpellCheckUnderline)
-                        except Exception:
-                            fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SingleUnderline)
-                    fmt.setUnderlineColor(QColor('#ff5c5c'))
-                except Exception:
-                    # fallback: set background if underline unsupported
-                    fmt.setBackground(QColor('#3a2b2b'))
-                sel.format = fmt
-                sel.cursor = cursor
-                sels.append(sel)
             except Exception:
                 continue
+            sel = QPlainTextEdit.ExtraSelection()
+            sel.format = fmt
+            sel.cursor = cursor
+            sels.append(sel)
 
+        # hand the editor the full set once, after the loop
+        try:
             try:
-                try:
-                    # pass positions to editor for custom squiggle drawing
-                    editor.set_lint_error_positions(pos_list)
-                except Exception as e:
-                    _handle_suppressed(e, locals().get('self', None))
-                editor.setExtraSelections(sels)
+                # pass positions to editor for custom squiggle drawing
+                editor.set_lint_error_positions(pos_list)
             except Exception as e:
                 _handle_suppressed(e, locals().get('self', None))
+            editor.setExtraSelections(sels)
+        except Exception as e:
+            _handle_suppressed(e, locals().get('self', None))
 
         return False
 
@@ -1340,6 +2176,14 @@ class GSCIDEWindow(QMainWindow):
                 except Exception as e:
                     _handle_suppressed(e, locals().get('self', None))
 
+    def _find_text(self, editor):
+        """Plain text of the editor, rebuilt only after the text changed."""
+        text = self._find_text_cache.get(editor)
+        if text is None:
+            text = editor.toPlainText()
+            self._find_text_cache[editor] = text
+        return text
+
     def replace_one(self):
         needle = self.find_input.text()
         repl = self.replace_input.text()
@@ -1353,9 +2197,12 @@ class GSCIDEWindow(QMainWindow):
             cursor.insertText(repl)
             editor.setTextCursor(cursor)
         else:
-            if editor.find(needle):
-                cursor = editor.textCursor()
-                cursor.insertText(repl)
+            # search the document from the cursor directly; editor.find would
+            # also select and scroll to the match before it is replaced
+            found = editor.document().find(needle, cursor)
+            if not found.isNull():
+                found.insertText(repl)
+                editor.setTextCursor(found)
                 editor.centerCursor()
     
     def find_next(self):
@@ -1427,7 +2274,7 @@ class GSCIDEWindow(QMainWindow):
         if editor is None:
             return
         try:
-            text = editor.toPlainText()
+            text = self._find_text(editor)
             cursor = editor.textCursor()
             pos = cursor.selectionEnd() if cursor.hasSelection() else cursor.position()
             # search backwards from just before current position
@@ -1528,13 +2375,20 @@ class GSCIDEWindow(QMainWindow):
             running = False
             try:
                 running = self.injection_manager.is_game_running(game)
+                self._last_game_error = None
             except Exception as e:
                 # log but don't crash the UI
                 try:
-                    self.log(f"Error checking game status: {e}", success=False)
+                    if str(e) != self._last_game_error:
+                        self._last_game_error = str(e)
+                        self.log(f"Error checking game status: {e}", success=False)
                 except Exception as e:
                     _handle_suppressed(e, locals().get('self', None))
 
+            # unchanged state: skip the label text and stylesheet re-polish
+            if running == self._last_game_running:
+                return
+            self._last_game_running = running
             if running:
                 self.game_status_label.setText("● Game Running")
                 self.game_status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
@@ -1601,16 +2455,18 @@ class GSCIDEWindow(QMainWindow):
             if not self.caps_label:
                 return
             # ensure the label is visible in both themes; adapt colors
-            theme = getattr(self, 'current_theme', 'dark')
             if on:
-                self.caps_label.setText("CAPS ON")
-                self.caps_label.setStyleSheet("padding:2px 6px; border-radius:4px; background:#b22222; color:#fff; font-weight:bold;")
+                style = self._CAPS_ON
+            elif getattr(self, 'current_theme', 'dark') == 'dark':
+                style = self._CAPS_OFF_DARK
             else:
-                self.caps_label.setText("CAPS OFF")
-                if theme == 'dark':
-                    self.caps_label.setStyleSheet("padding:2px 6px; border-radius:4px; background: transparent; color:#fff; font-weight:bold;")
-                else:
-                    self.caps_label.setStyleSheet("padding:2px 6px; border-radius:4px; background: transparent; color:#000; font-weight:bold;")
+                style = self._CAPS_OFF_LIGHT
+            # polled every second: only restyle when the state actually changes
+            if style is getattr(self, '_caps_style', None):
+                return
+            self.caps_label.setText(style[0])
+            self.caps_label.setStyleSheet(style[1])
+            self._caps_style = style
         except Exception as e:
             try:
                 if hasattr(self, 'log_exception'):
@@ -1632,11 +2488,40 @@ class GSCIDEWindow(QMainWindow):
             self, "Open GSC Script", "", "GSC/GSCR Files (*.gsc *.gscr);;GSC Files (*.gsc);;GSCR Files (*.gscr);;All Files (*)"
         )
         if filename:
-            with open(filename, 'r', encoding='utf-8') as f:
-                content = f.read()
-            self.new_tab(filename=filename, content=content)
-            self.log(f"Opened: {filename}")
-            self.add_recent_file(filename)
+            self.open_path(filename)
+
+    def open_path(self, filename):
+        """Open a file in a new tab; large files load in the background."""
+        try:
+            size = os.path.getsize(filename)
+        except OSError:
+            size = 0
+        if size > self._ASYNC_OPEN_BYTES:
+            # parented to the window, so Qt keeps it alive until it finishes
+            loader = FileLoader(filename, self)
+            loader.loaded.connect(self._on_file_loaded)
+            loader.failed.connect(self._on_file_load_failed)
+            loader.finished.connect(loader.deleteLater)
+            loader.start()
+            self.log(f"Loading: {filename}")
+            return
+        # same refusal rules as FileLoader
+        try:
+            with open(filename, 'rb') as f:
+                content = _decode_script(f.read())
+        except (OSError, ValueError) as e:
+            self._on_file_load_failed(filename, str(e))
+            return
+        self._on_file_loaded(filename, content)
+
+    def _on_file_loaded(self, filename, content):
+        editor = self.new_tab(filename=filename, content=content)
+        self._record_tab_stat(editor, filename)
+        self.log(f"Opened: {filename}")
+        self.add_recent_file(filename)
+
+    def _on_file_load_failed(self, filename, reason):
+        QMessageBox.warning(self, "Error", f"Could not open {filename}: {reason}")
     
     def save_file(self):
         editor = self.current_editor()
@@ -1647,6 +2532,7 @@ class GSCIDEWindow(QMainWindow):
             try:
                 with open(cur_path, 'w', encoding='utf-8') as f:
                     f.write(editor.toPlainText())
+                self._record_tab_stat(editor, cur_path)
                 editor.document().setModified(False)
                 self.log(f"Saved: {cur_path}")
                 self.add_recent_file(cur_path)
@@ -1678,7 +2564,8 @@ class GSCIDEWindow(QMainWindow):
                     filename = f"{filename}.gsc"
                 with open(filename, 'w', encoding='utf-8') as f:
                     f.write(editor.toPlainText())
-                self.tab_paths[editor] = filename
+                self._set_tab_path(editor, filename)
+                self._record_tab_stat(editor, filename)
                 editor.document().setModified(False)
                 idx = self.tab_widget.indexOf(editor)
                 if idx >= 0:
@@ -1701,23 +2588,35 @@ class GSCIDEWindow(QMainWindow):
                     _handle_suppressed(e, locals().get('self', None))
 
     # --- Recent files management ---
+    def _recent_files(self):
+        """In-memory recent-files list, loaded from settings on first use."""
+        if self._recent is None:
+            recent = self.settings.value('recentFiles', []) or []
+            if isinstance(recent, str):
+                recent = [recent]
+            self._recent = list(recent)
+        return self._recent
+
     def update_recent_menu(self):
+        # nothing changed since the last build
+        if not self._recent_dirty:
+            return
         try:
             self.recent_menu.clear()
         except Exception:
             return
+        self._recent_dirty = False
 
-        recent = self.settings.value('recentFiles', []) or []
-        if isinstance(recent, str):
-            recent = [recent]
+        recent = self._recent_files()
 
         # show newest first
         for path in reversed(recent):
             if not path:
                 continue
-            action = QAction(path, self)
+            # owned by the menu so clear() frees it on the next rebuild
+            action = QAction(path, self.recent_menu)
             try:
-                action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon))
+                action.setIcon(self._icon(QStyle.StandardPixmap.SP_FileIcon))
             except Exception as e:
                 try:
                     self.log_exception("update_recent_menu: set action icon", e)
@@ -1729,18 +2628,8 @@ class GSCIDEWindow(QMainWindow):
 
         if recent:
             self.recent_menu.addSeparator()
-            clear_act = QAction("Clear Recent", self)
-            clear_act.triggered.connect(self.clear_recent_files)
-            self.recent_menu.addAction(clear_act)
-            # make clear recent reachable by shortcut
-            try:
-                clear_act.setShortcut(QKeySequence("Ctrl+Shift+R"))
-                self.addAction(clear_act)
-            except Exception as e:
-                try:
-                    self.log_exception("update_recent_menu: clear_act shortcut", e)
-                except Exception as e:
-                    _handle_suppressed(e, locals().get('self', None))
+            # shared with the File menu entry, which owns the Ctrl+Shift+R shortcut
+            self.recent_menu.addAction(self._clear_recent_act)
 
     # --- Preferences dialog ---
     def open_preferences(self):
@@ -1762,10 +2651,7 @@ class GSCIDEWindow(QMainWindow):
         # Live linting toggle
         lint_chk = QCheckBox("Lint as you type")
         try:
-            lint_val = self.settings.value('lint_live', True)
-            if isinstance(lint_val, str):
-                lint_val = lint_val.lower() in ('1', 'true', 'yes', 'on')
-            lint_chk.setChecked(bool(lint_val))
+            lint_chk.setChecked(_as_bool(self.settings.value('lint_live', True), True))
         except Exception:
             lint_chk.setChecked(True)
         form.addRow("Live linting:", lint_chk)
@@ -1810,6 +2696,7 @@ class GSCIDEWindow(QMainWindow):
             # persist live lint preference
             try:
                 self.settings.setValue('lint_live', lint_chk.isChecked())
+                self._lint_live = lint_chk.isChecked()
             except Exception as e:
                 try:
                     self.log_exception("preferences:on_save lint_live", e)
@@ -1871,9 +2758,10 @@ class GSCIDEWindow(QMainWindow):
     def add_recent_file(self, filename):
         if not filename:
             return
-        recent = self.settings.value('recentFiles', []) or []
-        if isinstance(recent, str):
-            recent = [recent]
+        recent = self._recent_files()
+        # already the most recent entry: nothing to persist or rebuild
+        if recent and recent[-1] == filename:
+            return
 
         # normalize and keep uniqueness
         try:
@@ -1883,22 +2771,21 @@ class GSCIDEWindow(QMainWindow):
         recent.append(filename)
         # keep max 10
         recent = recent[-10:]
+        self._recent = recent
         self.settings.setValue('recentFiles', recent)
-        self.update_recent_menu()
+        # the menu is rebuilt from _recent when it is next opened
+        self._recent_dirty = True
 
     def open_recent_file(self, filename):
         if not filename or not os.path.exists(filename):
             QMessageBox.warning(self, "Error", f"File not found: {filename}")
             return
-        with open(filename, 'r', encoding='utf-8') as f:
-            content = f.read()
-        self.new_tab(filename=filename, content=content)
-        self.log(f"Opened: {filename}")
-        self.add_recent_file(filename)
+        self.open_path(filename)
 
     def clear_recent_files(self):
+        self._recent = []
         self.settings.setValue('recentFiles', [])
-        self.update_recent_menu()
+        self._recent_dirty = True
     
     def deploy_script(self):
         try:
@@ -1982,15 +2869,28 @@ class GSCIDEWindow(QMainWindow):
                     _handle_suppressed(e, locals().get('self', None))
 
     # --- Tab management ---
-    def new_tab(self, filename: str = None, content: str = None):
+    def _ensure_highlighter(self, editor):
+        """Attach a syntax highlighter to the editor if it has none yet."""
+        if not isinstance(editor, GSCEditor) or editor.highlighter is not None:
+            return
+        try:
+            # construction schedules the initial highlight pass over the document
+            editor.highlighter = GSCSyntaxHighlighter(editor.document())
+        except Exception as e:
+            _handle_suppressed(e, locals().get('self', None))
+
+    def new_tab(self, filename: str = None, content: str = None, make_current: bool = True):
+        """Open an editor tab. Background tabs (make_current=False) get their
+        highlighter only when first shown."""
         editor = GSCEditor()
         if content is None:
             content = editor.get_default_template()
         editor.setPlainText(content)
-        self.tab_paths[editor] = filename
-        title = os.path.basename(filename) if filename else "Untitled"
+        self._set_tab_path(editor, filename)
+        title = self.tab_basenames[editor]
         idx = self.tab_widget.addTab(editor, title)
-        self.tab_widget.setCurrentIndex(idx)
+        if make_current:
+            self.tab_widget.setCurrentIndex(idx)
         self.attach_editor_signals(editor)
         return editor
 
@@ -2011,6 +2911,11 @@ class GSCIDEWindow(QMainWindow):
                 except Exception as e:
                     _handle_suppressed(e, locals().get('self', None))
             self.tab_widget.removeTab(index)
+            # closed tabs must drop out of the autosave sweep (see autosave_all)
+            if isinstance(widget, GSCEditor):
+                self.tab_paths.pop(widget, None)
+                self.tab_basenames.pop(widget, None)
+                self.remove_autosave_for(widget)
         except Exception as e:
             try:
                 if hasattr(self, 'log_exception'):
@@ -2073,36 +2978,27 @@ class GSCIDEWindow(QMainWindow):
     def apply_theme(self, theme_name: str):
         theme_name = theme_name or 'dark'
         self.current_theme = theme_name
-        # simple theme flip: reapply stylesheet with light/dark variants
-        if theme_name == 'light':
-            light_css = """
-            QMainWindow { background-color: #f3f6f8; }
-            QLabel { color: #1b1f23; }
-            QComboBox, QLineEdit { background-color: #ffffff; color: #1b1f23; border: 1px solid #cfd8dc; }
-            QPlainTextEdit, QTextEdit { background-color: #ffffff; color: #1b1f23; border: 1px solid #d0d7db; }
-            QGroupBox { color: #1b1f23; border: 1px solid #d0d7db; }
-            QStatusBar { background-color: #e0e7ea; color: #1b1f23; }
-            """
-            self.setStyleSheet(light_css)
-        else:
-            # dark (default) - restore stored base stylesheet
+        # restyling the whole widget tree is expensive: only do it when the theme changes
+        if theme_name == getattr(self, '_applied_theme', None):
+            return
+        try:
+            self.setStyleSheet(self.LIGHT_CSS if theme_name == 'light' else self.DARK_CSS)
+            self._applied_theme = theme_name
+        except Exception as e:
             try:
-                self.setStyleSheet(self.base_css)
-            except Exception as e:
+                if hasattr(self, 'log_exception'):
+                    self.log_exception("suppressed exception", e)
+                else:
+                    traceback.print_exc()
+            except Exception:
                 try:
-                    if hasattr(self, 'log_exception'):
-                        self.log_exception("suppressed exception", e)
-                    else:
-                        traceback.print_exc()
-                except Exception:
-                    try:
-                        traceback.print_exc()
-                    except Exception as e:
-                        _handle_suppressed(e, locals().get('self', None))
+                    traceback.print_exc()
+                except Exception as e:
+                    _handle_suppressed(e, locals().get('self', None))
 
         # persist
         try:
-            self.settings.setValue('theme', theme_name)
+            self._defer_setting('theme', theme_name)
         except Exception as e:
             try:
                 if hasattr(self, 'log_exception'):
@@ -2115,6 +3011,16 @@ class GSCIDEWindow(QMainWindow):
                 except Exception as e:
                     _handle_suppressed(e, locals().get('self', None))
 
+    def _defer_setting(self, key, value):
+        """Queue a settings write; rapid repeats collapse into one."""
+        self._pending_settings[key] = value
+        self._settings_flush_timer.start()
+
+    def _flush_deferred_settings(self):
+        pending, self._pending_settings = self._pending_settings, {}
+        for key, value in pending.items():
+            self.settings.setValue(key, value)
+
     def toggle_theme(self):
         new_theme = 'light' if getattr(self, 'current_theme', 'dark') == 'dark' else 'dark'
         self.apply_theme(new_theme)
@@ -2131,7 +3037,7 @@ class GSCIDEWindow(QMainWindow):
             # update line number metrics
             self.editor.update_line_number_area_width(0)
             try:
-                self.settings.setValue('editor_font_size', new_size)
+                self._defer_setting('editor_font_size', new_size)
             except Exception as e:
                 _handle_suppressed(e, locals().get('self', None))
         except Exception as e:
@@ -2147,11 +3053,20 @@ class GSCIDEWindow(QMainWindow):
                     _handle_suppressed(e, locals().get('self', None))
 
     def closeEvent(self, event):
-        # Persist panel visibility and theme on close
+        # Persist panel visibility and theme on close, with any debounced writes,
+        # as one batch followed by a single sync
         try:
-            self.settings.setValue('panel_injection', self.injection_group.isVisible())
-            self.settings.setValue('panel_output', self.output_group.isVisible())
-            self.settings.setValue('theme', getattr(self, 'current_theme', 'dark'))
+            self._settings_flush_timer.stop()
+            session = self._pending_settings
+            self._pending_settings = {}
+            session.update({
+                'panel_injection': self.injection_group.isVisible(),
+                'panel_output': self.output_group.isVisible(),
+                'theme': getattr(self, 'current_theme', 'dark'),
+            })
+            for key, value in session.items():
+                self.settings.setValue(key, value)
+            self.settings.close()
         except Exception as e:
             try:
                 if hasattr(self, 'log_exception'):
@@ -2165,10 +3080,24 @@ class GSCIDEWindow(QMainWindow):
                     _handle_suppressed(e, locals().get('self', None))
         # If there are modified (unsaved) tabs, preserve autosave artifacts
         try:
+            # editors collected during teardown must not take their autosaves with them
+            self._autosave_closing = True
+            # finish queued autosave writes; from here on autosave I/O is direct
+            writer = getattr(self, 'autosave_writer', None)
+            if writer is not None:
+                self.autosave_writer = None
+                writer.stop()
             preserve_autosave = False
             if getattr(self, 'autosave_dir', None) and os.path.exists(self.autosave_dir):
-                for i in range(getattr(self, 'tab_widget').count() if getattr(self, 'tab_widget', None) else 0):
-                    w = self.tab_widget.widget(i)
+                template_stripped = GSCEditor._DEFAULT_TEMPLATE_STRIPPED
+                # loop-invariant lookups hoisted into locals
+                tw = getattr(self, 'tab_widget', None)
+                count = tw.count() if tw is not None else 0
+                get_widget = tw.widget if tw is not None else None
+                tab_paths = getattr(self, 'tab_paths', {})
+                tab_stat = getattr(self, '_tab_stat', {})
+                for i in range(count):
+                    w = get_widget(i)
                     try:
                         if not isinstance(w, GSCEditor):
                             continue
@@ -2181,17 +3110,31 @@ class GSCIDEWindow(QMainWindow):
                             _handle_suppressed(e, locals().get('self', None))
                         # If no path assigned, but content differs from default template, consider unsaved
                         try:
-                            assigned = self.tab_paths.get(w)
-                            content = w.toPlainText()
-                            if assigned is None and content.strip() and content.strip() != w.get_default_template().strip():
-                                preserve_autosave = True
-                                break
+                            assigned = tab_paths.get(w)
+                            if assigned is None:
+                                cs = w.toPlainText().strip()
+                                if cs and cs != template_stripped:
+                                    preserve_autosave = True
+                                    break
                             # if assigned, compare with on-disk file to detect unsaved changes
                             if assigned and os.path.exists(assigned):
+                                # unmodified and the file unchanged since load/save: the
+                                # text matches the disk; a stat settles it without a read
+                                known = tab_stat.get(w)
+                                if known is not None:
+                                    try:
+                                        st = os.stat(assigned)
+                                    except OSError:
+                                        preserve_autosave = True
+                                        break
+                                    if (st.st_size, st.st_mtime_ns) != known:
+                                        preserve_autosave = True
+                                        break
+                                    continue
                                 try:
                                     with open(assigned, 'r', encoding='utf-8') as f:
                                         disk = f.read()
-                                    if disk != content:
+                                    if disk != w.toPlainText():
                                         preserve_autosave = True
                                         break
                                 except Exception:
@@ -2203,22 +3146,30 @@ class GSCIDEWindow(QMainWindow):
                         _handle_suppressed(e, locals().get('self', None))
 
             if preserve_autosave:
-                # ensure latest content is saved for recovery
+                # ensure latest content is saved for recovery, then compact the index
                 try:
                     self.autosave_all()
+                    self._write_autosave_index()
                 except Exception as e:
                     _handle_suppressed(e, locals().get('self', None))
             else:
                 # no unsaved edits: remove autosave artifacts
                 try:
-                    if getattr(self, 'autosave_index', None) and os.path.exists(self.autosave_index):
-                        with open(self.autosave_index, 'r', encoding='utf-8') as f:
-                            entries = json.load(f)
+                    entries = None
+                    if getattr(self, 'autosave_index', None):
+                        try:
+                            with open(self.autosave_index, 'rb') as f:
+                                entries = _parse_autosave_index(f.read())
+                        except FileNotFoundError:
+                            pass
+                    if entries is not None:
+                        join = os.path.join
+                        ad = self.autosave_dir
                         for e in entries:
-                            p = os.path.join(self.autosave_dir, e.get('file'))
+                            p = join(ad, e.get('file'))
                             try:
-                                if os.path.exists(p):
-                                    os.remove(p)
+                                _remove_if_exists(p)
+                                _remove_if_exists(_wal_path(p))
                             except Exception as e:
                                 _handle_suppressed(e, locals().get('self', None))
                         try:
@@ -2244,15 +3195,21 @@ class GSCIDEWindow(QMainWindow):
             event.accept()
 
     def eventFilter(self, obj, event):
-        # Close the find widget on Escape when editor has focus
-        try:
-            if event.type() == QEvent.KeyPress:
-                key = event.key()
-                if key == Qt.Key.Key_Escape and getattr(self, 'find_widget', None) and self.find_widget.isVisible():
-                    self.find_widget.setVisible(False)
-                    return True
-        except Exception as e:
-            _handle_suppressed(e, locals().get('self', None))
+        # only key events matter here; everything else (paints, mouse moves) passes straight on
+        etype = event.type()
+        if etype != QEvent.Type.KeyPress and etype != QEvent.Type.KeyRelease:
+            return super().eventFilter(obj, event)
+        key = event.key()
+        # refresh the Caps Lock label right away instead of waiting for the poll
+        if key == Qt.Key.Key_CapsLock:
+            self.update_caps_lock()
+        # Close the find widget on Escape when editor has focus; Escape meant for
+        # dialogs and other widgets is left alone
+        elif key == Qt.Key.Key_Escape and etype == QEvent.Type.KeyPress and isinstance(obj, GSCEditor):
+            fw = self._find_widget
+            if fw is not None and fw.isVisible():
+                fw.setVisible(False)
+                return True
         return super().eventFilter(obj, event)
 
     # --- Autosave and recovery ---
@@ -2260,45 +3217,17 @@ class GSCIDEWindow(QMainWindow):
         try:
             if not getattr(self, 'autosave_dir', None):
                 return
-            entries = []
-            for i in range(self.tab_widget.count()):
-                w = self.tab_widget.widget(i)
+            self._drop_orphaned_autosaves()
+            # one global tick covers every open editor; clean ones short-circuit here
+            for w, filename in list(self.tab_paths.items()):
                 if not isinstance(w, GSCEditor):
                     continue
-                # only autosave if modified
-                try:
-                    if not w.document().isModified():
-                        continue
-                except Exception as e:
-                    _handle_suppressed(e, locals().get('self', None))
-                filename = self.tab_paths.get(w)
-                # reuse existing autosave file for this editor when possible
-                existing = self.autosave_map.get(w)
-                if existing:
-                    fname = existing
-                else:
-                    fname = f"autosave_{uuid.uuid4().hex}.json"
-                    self.autosave_map[w] = fname
-                path = os.path.join(self.autosave_dir, fname)
-                data = {'filename': filename, 'content': w.toPlainText()}
+                if not w.is_modified():
+                    continue
                 try:
-                    with open(path, 'w', encoding='utf-8') as f:
-                        json.dump(data, f)
-                    entries.append({'file': fname, 'filename': filename})
+                    self._autosave_one(w, filename)
                 except Exception as e:
                     _handle_suppressed(e, locals().get('self', None))
-
-            # write index
-            try:
-                if entries:
-                    with open(self.autosave_index, 'w', encoding='utf-8') as f:
-                        json.dump(entries, f)
-                else:
-                    # remove index if no entries
-                    if os.path.exists(self.autosave_index):
-                        os.remove(self.autosave_index)
-            except Exception as e:
-                _handle_suppressed(e, locals().get('self', None))
         except Exception as e:
             _handle_suppressed(e, locals().get('self', None))
 
@@ -2306,98 +3235,252 @@ class GSCIDEWindow(QMainWindow):
         try:
             if not getattr(self, 'autosave_dir', None):
                 return
-            if not os.path.exists(self.autosave_index):
+            try:
+                # anything shorter than a one-entry list holds nothing to recover
+                if os.stat(self.autosave_index).st_size < 3:
+                    return
+                with open(self.autosave_index, 'rb') as f:
+                    entries = _parse_autosave_index(f.read())
+            except FileNotFoundError:
                 return
-            with open(self.autosave_index, 'r', encoding='utf-8') as f:
-                entries = json.load(f)
             if not entries:
                 return
-            resp = QMessageBox.question(self, "Recover Autosave", "Autosave data from a previous session was found. Recover tabs?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-            if resp != QMessageBox.StandardButton.Yes:
+            dlg = getattr(self, '_recovery_dialog', None)
+            if dlg is None:
+                dlg = QMessageBox(QMessageBox.Icon.Question, "Recover Autosave",
+                                  "Autosave data from a previous session was found. Recover tabs?",
+                                  QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self)
+                self._recovery_dialog = dlg
+            dlg.exec()
+            if dlg.standardButton(dlg.clickedButton()) != QMessageBox.StandardButton.Yes:
                 return
-            # load each autosave as a tab
-            for e in entries:
+            # load each autosave as a tab, one per event-loop turn, so the window
+            # comes up with the first recovered tab instead of after all of them
+            self._recover_next(deque(entries), entries)
+        except Exception as e:
+            _handle_suppressed(e, locals().get('self', None))
+
+    def _recover_next(self, pending, entries):
+        """Open the next recovered tab; after the last one, delete the recovered files."""
+        if getattr(self, '_autosave_closing', False):
+            return
+        if pending:
+            e = pending.popleft()
+            try:
                 p = os.path.join(self.autosave_dir, e.get('file'))
+                with open(p, 'rb') as f:
+                    data = _json_loads(f.read())
+                content = data.get('content')
+                # replay the edits logged after the snapshot was written
+                if content is not None and data.get('gen') is not None:
+                    try:
+                        with open(_wal_path(p), 'rb') as f:
+                            content = _replay_wal(content, f.read(), data['gen'])
+                    except FileNotFoundError:
+                        pass
+                # only the first recovered tab is brought forward; the rest stay
+                # in the background and are not highlighted until opened
+                self.new_tab(filename=data.get('filename'), content=content,
+                             make_current=len(pending) == len(entries) - 1)
+            except Exception as e:
+                _handle_suppressed(e, locals().get('self', None))
+            QTimer.singleShot(0, lambda: self._recover_next(pending, entries))
+            return
+        # remove autosave artifacts after recovery
+        try:
+            join = os.path.join
+            ad = self.autosave_dir
+            for e in entries:
+                p = join(ad, e.get('file'))
                 try:
-                    with open(p, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    self.new_tab(filename=data.get('filename'), content=data.get('content'))
+                    _remove_if_exists(p)
+                    _remove_if_exists(_wal_path(p))
                 except Exception as e:
                     _handle_suppressed(e, locals().get('self', None))
-            # remove autosave artifacts after recovery
+            # this session may have written its own index by now: rebuild it
+            # rather than deleting it
+            self._write_autosave_index()
+        except Exception as e:
+            _handle_suppressed(e, locals().get('self', None))
+
+    def _mark_autosave_dirty(self, editor: GSCEditor):
+        self._autosave_dirty.add(editor)
+        self._autosave_sweep.start()
+
+    def _autosave_sweep_cb(self):
+        """Autosave every editor edited since the last sweep."""
+        self._drop_orphaned_autosaves()
+        dirty = list(self._autosave_dirty)
+        self._autosave_dirty.clear()
+        for editor in dirty:
+            # closed tabs are no longer tracked in tab_paths
+            if editor in self.tab_paths:
+                self.autosave_editor(editor)
+
+    def _write_autosave_index(self):
+        """Rewrite (compact) the index from autosave_map; removes it when nothing is tracked."""
+        records = []
+        for ed, fname in list(self.autosave_map.items()):
+            records.append(_json_dumps({'op': 'upsert', 'file': fname, 'filename': self.tab_paths.get(ed)}) + b'\n')
+        self._autosave_index_lines = len(records)
+        self._autosave_put(self.autosave_index, b''.join(records) if records else None)
+
+    def _log_autosave_index(self, record):
+        """Append one upsert/remove record to the index, compacting it once
+        it holds more than twice as many records as there are live entries."""
+        n = self._autosave_index_lines
+        if n is None or n + 1 > 2 * len(self.autosave_map):
+            self._write_autosave_index()
+            return
+        self._autosave_index_lines = n + 1
+        self._autosave_append(self.autosave_index, _json_dumps(record) + b'\n')
+
+    def _autosave_put(self, path: str, blob):
+        """Write blob to path, or remove path when blob is None.
+
+        Goes through the autosave writer thread while it runs, so writes and
+        removals of the same file stay in order; direct I/O otherwise.
+        """
+        writer = getattr(self, 'autosave_writer', None)
+        if writer is not None:
+            writer.enqueue(path, blob)
+        elif blob is None:
+            _remove_if_exists(path)
+        else:
+            _write_atomic(path, blob)
+
+    def _autosave_append(self, path: str, blob: bytes):
+        """Append blob to path, in order with the jobs given to _autosave_put."""
+        writer = getattr(self, 'autosave_writer', None)
+        if writer is not None:
+            writer.append(path, blob)
+        else:
+            with open(path, 'ab') as f:
+                f.write(blob)
+
+    def _record_autosave_change(self, editor: GSCEditor, pos: int, removed: int, added: int):
+        """Log one document change against the editor's autosave snapshot."""
+        wal = self._autosave_wal.get(editor)
+        if wal is None or wal.broken:
+            return
+        doc = editor.document()
+        length = doc.characterCount() - 1
+        # Qt can over-report changes that touch the end of the document; an
+        # edit that doesn't add up can't be replayed, so fall back to a snapshot
+        if wal.length - removed + added != length or pos + added > length:
+            wal.broken = True
+            wal.pending = []
+            return
+        wal.length = length
+        text = ''
+        if added:
+            cursor = QTextCursor(doc)
+            cursor.setPosition(pos)
+            cursor.setPosition(pos + added, QTextCursor.MoveMode.KeepAnchor)
+            text = cursor.selectedText().translate(_PLAIN_TEXT_TABLE)
+        wal.pending.append(_json_dumps({'g': wal.gen, 'p': pos, 'r': removed, 'a': text}) + b'\n')
+
+    def _autosave_one(self, editor: GSCEditor, filename) -> str:
+        """Bring one editor's autosave up to date; returns its file name.
+
+        While the last snapshot still applies only the edits logged since the
+        previous save are appended to its .wal file; otherwise the full text
+        is written as a new snapshot and the log starts over.
+        """
+        fname = self.autosave_map.get(editor)
+        if fname:
+            path = os.path.join(self.autosave_dir, fname)
+        else:
+            fname = f"autosave_{uuid.uuid4().hex}.json"
+            self.autosave_map[editor] = fname
+            path = os.path.join(self.autosave_dir, fname)
+            # the map entry vanishes with the editor; take its files along too
+            fin = finalize(editor, self._orphaned_autosaves.put, path)
+            fin.atexit = False
+            self._autosave_finalizers[editor] = fin
+        wal = self._autosave_wal.get(editor)
+        prev = self._autosave_fp.get(editor)
+        if (wal is not None and not wal.broken and prev is not None and prev[0] == filename
+                and wal.logged < max(self._WAL_COMPACT_MIN, wal.length)):
+            if wal.pending:
+                blob = b''.join(wal.pending)
+                wal.pending = []
+                wal.logged += len(blob)
+                self._autosave_append(_wal_path(path), blob)
+            return fname
+        content = editor.toPlainText()
+        # nothing to write when the text is what the snapshot alone holds
+        fp = (filename, hash(content))
+        if fp == prev and wal is not None and not wal.logged and os.path.exists(path):
+            return fname
+        gen = next(self._autosave_gens)
+        self._autosave_put(path, _json_dumps({'filename': filename, 'content': content, 'gen': gen}))
+        # records logged against the previous snapshot no longer apply
+        self._autosave_put(_wal_path(path), None)
+        self._autosave_wal[editor] = AutosaveLog(gen, editor.document().characterCount() - 1)
+        self._autosave_fp[editor] = fp
+        # a new entry or a renamed tab changes what the index lists
+        if prev is None or prev[0] != filename:
+            self._log_autosave_index({'op': 'upsert', 'file': fname, 'filename': filename})
+        return fname
+
+    def _drop_orphaned_autosaves(self):
+        """Remove the files of editors collected without remove_autosave_for.
+
+        Their finalizers only queue the path: GC can run them on any thread,
+        including the autosave writer while it holds its mutex.
+        """
+        queue = self._orphaned_autosaves
+        while not queue.empty():
+            path = queue.get()
+            # editors torn down with the window keep what closeEvent preserved
+            if getattr(self, '_autosave_closing', False):
+                continue
             try:
-                for e in entries:
-                    p = os.path.join(self.autosave_dir, e.get('file'))
-                    try:
-                        if os.path.exists(p):
-                            os.remove(p)
-                    except Exception as e:
-                        _handle_suppressed(e, locals().get('self', None))
-                if os.path.exists(self.autosave_index):
-                    os.remove(self.autosave_index)
+                self._autosave_put(path, None)
+                self._autosave_put(_wal_path(path), None)
+                self._log_autosave_index({'op': 'remove', 'file': os.path.basename(path)})
             except Exception as e:
                 _handle_suppressed(e, locals().get('self', None))
-        except Exception as e:
-            _handle_suppressed(e, locals().get('self', None))
 
     def autosave_editor(self, editor: GSCEditor):
+        """Autosave one editor. Returns True when it is tracked in autosave_map."""
         try:
             if not getattr(self, 'autosave_dir', None):
                 return
             if not isinstance(editor, GSCEditor):
                 return
-            # always save current content for this editor
-            filename = self.tab_paths.get(editor)
-            existing = self.autosave_map.get(editor)
-            if existing:
-                fname = existing
-            else:
-                fname = f"autosave_{uuid.uuid4().hex}.json"
-                self.autosave_map[editor] = fname
-            path = os.path.join(self.autosave_dir, fname)
-            data = {'filename': filename, 'content': editor.toPlainText()}
             try:
-                with open(path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f)
-            except Exception as e:
-                _handle_suppressed(e, locals().get('self', None))
-            # update index
-            try:
-                entries = []
-                # include all autosave files currently tracked
-                for ed, fname in list(self.autosave_map.items()):
-                    entries.append({'file': fname, 'filename': self.tab_paths.get(ed)})
-                with open(self.autosave_index, 'w', encoding='utf-8') as f:
-                    json.dump(entries, f)
+                self._autosave_one(editor, self.tab_paths.get(editor))
             except Exception as e:
                 _handle_suppressed(e, locals().get('self', None))
+            return True
         except Exception as e:
             _handle_suppressed(e, locals().get('self', None))
+        return False
 
     def remove_autosave_for(self, editor: GSCEditor):
         try:
             if not getattr(self, 'autosave_dir', None):
                 return
+            self._autosave_fp.pop(editor, None)
+            self._autosave_wal.pop(editor, None)
+            # removed here already; the finalizer would only log a second removal
+            fin = self._autosave_finalizers.pop(editor, None)
+            if fin is not None:
+                fin.detach()
             fname = self.autosave_map.pop(editor, None)
             if not fname:
                 return
             path = os.path.join(self.autosave_dir, fname)
             try:
-                if os.path.exists(path):
-                    os.remove(path)
+                self._autosave_put(path, None)
+                self._autosave_put(_wal_path(path), None)
             except Exception as e:
                 _handle_suppressed(e, locals().get('self', None))
-            # rebuild index
-            try:
-                entries = []
-                for ed, f in list(self.autosave_map.items()):
-                    entries.append({'file': f, 'filename': self.tab_paths.get(ed)})
-                if entries:
-                    with open(self.autosave_index, 'w', encoding='utf-8') as f:
-                        json.dump(entries, f)
-                else:
-                    if os.path.exists(self.autosave_index):
-                        os.remove(self.autosave_index)
+            # update index
+            try:
+                self._log_autosave_index({'op': 'remove', 'file': fname})
             except Exception as e:
                 _handle_suppressed(e, locals().get('self', None))
         except Exception as e: